@@ -80,7 +80,7 @@ if [ ! -f ".env" ]; then
         # Create a basic .env file
         cat > .env << EOF
 # Database
-DATABASE_URL=sqlite:///./interestify.db
+DATABASE_URL=sqlite+aiosqlite:///./interestify.db
 
 # API Keys (replace with your actual keys)
 TWITTER_API_KEY=your_twitter_api_key
@@ -72,7 +72,7 @@ print_status "Starting Interestify v2.0..."
 if [ ! -f ".env" ]; then
     print_warning "No .env file found. Creating basic configuration..."
     cp .env.example .env 2>/dev/null || cat > .env << EOF
-DATABASE_URL=sqlite:///./interestify.db
+DATABASE_URL=sqlite+aiosqlite:///./interestify.db
 TWITTER_API_KEY=your_twitter_api_key
 TWITTER_API_SECRET=your_twitter_api_secret
 REDDIT_CLIENT_ID=your_reddit_client_id
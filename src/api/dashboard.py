@@ -1,16 +1,67 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from collections import defaultdict
+import functools
 import re
+import time
 
 from fastapi import APIRouter, Query, HTTPException
 
+from src.api.responses import DefaultJSONResponse
 from src.models.schemas import SentimentType
 
-router = APIRouter(prefix="/api/v1/dashboard", tags=["dashboard"])
+router = APIRouter(
+    prefix="/api/v1/dashboard",
+    tags=["dashboard"],
+    default_response_class=DefaultJSONResponse,
+)
+
+# Seconds a dashboard response is reused for identical query parameters
+DASHBOARD_CACHE_TTL = 30.0
+
+# Maximum number of distinct parameter sets cached per endpoint
+DASHBOARD_CACHE_SIZE = 128
+
+
+def _cache_key(params: Dict[str, Any]) -> Tuple:
+    """Build a hashable cache key from handler parameters"""
+    return tuple(
+        (name, tuple(value) if isinstance(value, (list, set)) else value)
+        for name, value in sorted(params.items())
+    )
+
+
+def cached_response(handler):
+    """Reuse a handler's response for identical parameters for DASHBOARD_CACHE_TTL"""
+    cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+    @functools.wraps(handler)
+    async def wrapper(**params):
+        key = _cache_key(params)
+        try:
+            entry = cache.get(key)
+        except TypeError:
+            # Parameters that still cannot be hashed are served uncached
+            return await handler(**params)
+        if entry is not None:
+            cached_at, response = entry
+            if time.monotonic() - cached_at < DASHBOARD_CACHE_TTL:
+                return response
+            del cache[key]
+
+        response = await handler(**params)
+        if len(cache) >= DASHBOARD_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            del cache[next(iter(cache))]
+        cache[key] = (time.monotonic(), response)
+        return response
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
 
 
 @router.get("/geographic-sentiment", response_model=Dict[str, Any])
+@cached_response
 async def get_geographic_sentiment_data(
     query: Optional[str] = Query(None, description="Filter by query term"),
     start_date: Optional[datetime] = Query(None, description="Start date filter"),
@@ -90,6 +141,7 @@ async def get_geographic_sentiment_data(
 
 
 @router.get("/interest-trends", response_model=Dict[str, Any])
+@cached_response
 async def get_interest_trends(
     regions: Optional[List[str]] = Query(None, description="Filter by specific regions"),
     timeframe: str = Query(default="7d", description="Timeframe: 1d, 7d, 30d"),
@@ -148,6 +200,7 @@ async def get_interest_trends(
 
 
 @router.get("/summary", response_model=Dict[str, Any])
+@cached_response
 async def get_dashboard_summary():
     """
     Get overall dashboard summary statistics
@@ -200,6 +253,7 @@ async def get_dashboard_summary():
 
 
 @router.get("/heat-map", response_model=Dict[str, Any])
+@cached_response
 async def get_sentiment_heat_map(
     topic: Optional[str] = Query(None, description="Filter by specific topic"),
     timeframe: str = Query(default="7d", description="Timeframe: 1d, 7d, 30d"),
@@ -266,6 +320,7 @@ async def get_sentiment_heat_map(
 
 
 @router.get("/analytics", response_model=Dict[str, Any])
+@cached_response
 async def get_advanced_analytics():
     """
     Get advanced analytics data for enhanced dashboard widgets
@@ -0,0 +1,17 @@
+"""
+JSON response class shared by the API routers
+
+orjson is listed in requirements.txt and serializes responses faster; if it
+is missing, responses fall back to FastAPI's standard JSONResponse.
+"""
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library encoder
+    orjson = None
+
+# Response class used for JSON routes, preferring orjson when it is installed
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
@@ -5,10 +5,15 @@ Security-related configuration with proper validation and encryption support.
 """
 
 import os
+import re
 import secrets
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 
+# Characters accepted as "special" by validate_password
+SPECIAL_CHARACTERS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+_SPECIAL_CHARACTER_RE = re.compile(f"[{re.escape(SPECIAL_CHARACTERS)}]")
+
 
 class APIKeyConfig(BaseModel):
     """API key configuration"""
@@ -154,7 +159,7 @@ class SecurityConfig(BaseModel):
         if self.require_numbers and not any(c.isdigit() for c in password):
             errors.append("Password must contain at least one number")
         
-        if self.require_special_chars and not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+        if self.require_special_chars and not _SPECIAL_CHARACTER_RE.search(password):
             errors.append("Password must contain at least one special character")
         
         return len(errors) == 0, errors
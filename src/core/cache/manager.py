@@ -1,35 +1,70 @@
+import functools
 import hashlib
 import json
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.models.schemas import AnalysisResult, SearchQuery
 
 
+@functools.lru_cache(maxsize=1024)
+def _hash_query_params(params: Tuple) -> str:
+    """Hash the cache-relevant search query parameters"""
+    (
+        query,
+        data_sources,
+        limit,
+        start_date,
+        end_date,
+        include_sentiment,
+        min_confidence,
+        language,
+    ) = params
+    # Create a consistent hash of the query parameters
+    query_dict = {
+        "query": query,
+        "data_sources": list(data_sources),
+        "limit": limit,
+        "start_date": start_date,
+        "end_date": end_date,
+        "include_sentiment": include_sentiment,
+        "min_confidence": min_confidence,
+        "language": language,
+    }
+
+    query_str = json.dumps(query_dict, sort_keys=True)
+    return hashlib.blake2b(query_str.encode(), digest_size=16).hexdigest()
+
+
 class CacheManager:
     """In-memory cache manager for API responses"""
 
-    def __init__(self, default_ttl: int = 3600):
+    def __init__(
+        self, default_ttl: int = 3600, time_fn: Callable[[], float] = time.time
+    ):
         self._cache: Dict[str, Dict] = {}
         self.default_ttl = default_ttl
+        # Clock for entry timestamps; wall-clock seconds since
+        # get_cached_queries reports them as datetimes
+        self._time_fn = time_fn
 
     def _generate_key(self, query: SearchQuery) -> str:
         """Generate cache key from search query"""
-        # Create a consistent hash of the query parameters
-        query_dict = {
-            "query": query.query,
-            "data_sources": sorted(query.data_sources),
-            "limit": query.limit,
-            "start_date": query.start_date.isoformat() if query.start_date else None,
-            "end_date": query.end_date.isoformat() if query.end_date else None,
-            "include_sentiment": query.include_sentiment,
-            "min_confidence": query.min_confidence,
-            "language": query.language,
-        }
-
-        query_str = json.dumps(query_dict, sort_keys=True)
-        return hashlib.md5(query_str.encode()).hexdigest()
+        # The same parameters always hash to the same key, so the JSON
+        # encoding and hashing are memoized on a tuple of the values
+        return _hash_query_params(
+            (
+                query.query,
+                tuple(sorted(query.data_sources)),
+                query.limit,
+                query.start_date.isoformat() if query.start_date else None,
+                query.end_date.isoformat() if query.end_date else None,
+                query.include_sentiment,
+                query.min_confidence,
+                query.language,
+            )
+        )
 
     def get(self, query: SearchQuery) -> Optional[AnalysisResult]:
         """
@@ -47,9 +82,10 @@ class CacheManager:
             cache_entry = self._cache[cache_key]
 
             # Check if expired
-            if time.time() < cache_entry["expires_at"]:
+            now = self._time_fn()
+            if now < cache_entry["expires_at"]:
                 cache_entry["hit_count"] += 1
-                cache_entry["last_accessed"] = time.time()
+                cache_entry["last_accessed"] = now
                 return cache_entry["data"]
             else:
                 # Remove expired entry
@@ -70,13 +106,14 @@ class CacheManager:
         """
         cache_key = self._generate_key(query)
         ttl = ttl or self.default_ttl
+        now = self._time_fn()
 
         self._cache[cache_key] = {
             "data": result,
-            "created_at": time.time(),
-            "expires_at": time.time() + ttl,
+            "created_at": now,
+            "expires_at": now + ttl,
             "hit_count": 0,
-            "last_accessed": time.time(),
+            "last_accessed": now,
         }
 
     def invalidate(self, query: SearchQuery) -> bool:
@@ -104,7 +141,7 @@ class CacheManager:
         Returns:
             Number of entries removed
         """
-        current_time = time.time()
+        current_time = self._time_fn()
         expired_keys = []
 
         for key, entry in self._cache.items():
@@ -134,7 +171,7 @@ class CacheManager:
         Returns:
             Dictionary with cache statistics
         """
-        current_time = time.time()
+        current_time = self._time_fn()
         total_entries = len(self._cache)
         expired_entries = 0
         total_hits = 0
@@ -166,7 +203,7 @@ class CacheManager:
     def get_cached_queries(self) -> List[Dict[str, Any]]:
         """Get list of cached queries with metadata"""
         queries = []
-        current_time = time.time()
+        current_time = self._time_fn()
 
         for key, entry in self._cache.items():
             queries.append(
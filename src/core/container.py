@@ -9,6 +9,9 @@ from typing import Any, Callable, Dict, Optional, Type, TypeVar
 
 T = TypeVar('T')
 
+# Sentinel for singleton lookups, since None is a valid registered instance
+_MISSING = object()
+
 
 class Container:
     """Simple dependency injection container"""
@@ -17,6 +20,8 @@ class Container:
         self._services: Dict[str, Any] = {}
         self._factories: Dict[str, Callable] = {}
         self._singletons: Dict[str, Any] = {}
+        # Keys derived from service types, computed once per type
+        self._key_cache: Dict[Type, str] = {}
     
     def register_singleton(self, service_type: Type[T], instance: T) -> None:
         """Register a singleton instance"""
@@ -37,18 +42,15 @@ class Container:
         """Get an instance of the requested service"""
         key = self._get_key(service_type)
         
-        # Check if it's a singleton
-        if key in self._singletons:
-            return self._singletons[key]
+        # Check if it's a singleton; a single probe on the hot path
+        instance = self._singletons.get(key, _MISSING)
+        if instance is not _MISSING:
+            return instance
         
-        # Check if there's a factory
-        if key in self._factories:
-            factory = self._factories[key]
-            if callable(factory):
-                return factory()
-            else:
-                # It's a class, instantiate it
-                return factory()
+        # Check if there's a factory (a function or a class to instantiate)
+        factory = self._factories.get(key)
+        if factory is not None:
+            return factory()
         
         # Try to instantiate directly
         try:
@@ -65,7 +67,11 @@ class Container:
     
     def _get_key(self, service_type: Type) -> str:
         """Get string key for service type"""
-        return f"{service_type.__module__}.{service_type.__name__}"
+        key = self._key_cache.get(service_type)
+        if key is None:
+            key = f"{service_type.__module__}.{service_type.__name__}"
+            self._key_cache[service_type] = key
+        return key
     
     def clear(self) -> None:
         """Clear all registered services"""
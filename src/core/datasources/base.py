@@ -1,9 +1,19 @@
+import re
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from src.models.schemas import DataSourceConfig, Post, SearchQuery
 
+# Hashtags, mentions and URLs found in one left-to-right scan. Bounded
+# repeats cap how far a single match can scan into long tokens, and the
+# lookaheads reject tokens longer than the bound instead of truncating them.
+_ENTITY_RE = re.compile(
+    r"(?P<hashtags>#\w{1,64}(?!\w))"
+    r"|(?P<mentions>@\w{1,64}(?!\w))"
+    r"|(?P<urls>\bhttps?://[^\s<>\"']{1,2048}(?![^\s<>\"']))"
+)
+
 
 class DataSource(ABC):
     """Abstract base class for data sources"""
@@ -139,26 +149,24 @@ class DataSource(ABC):
 
         return text.strip()
 
+    def _extract_entities(self, text: str) -> Dict[str, List[str]]:
+        """Extract hashtags, mentions and URLs from text in a single pass"""
+        entities: Dict[str, List[str]] = {"hashtags": [], "mentions": [], "urls": []}
+        for match in _ENTITY_RE.finditer(text):
+            value = match.group()
+            if match.lastgroup != "urls":
+                value = value.lower()
+            entities[match.lastgroup].append(value)
+        return entities
+
     def _extract_hashtags(self, text: str) -> List[str]:
         """Extract hashtags from text"""
-        import re
-
-        hashtags = re.findall(r"#\w+", text)
-        return [tag.lower() for tag in hashtags]
+        return self._extract_entities(text)["hashtags"]
 
     def _extract_mentions(self, text: str) -> List[str]:
         """Extract mentions from text"""
-        import re
-
-        mentions = re.findall(r"@\w+", text)
-        return [mention.lower() for mention in mentions]
+        return self._extract_entities(text)["mentions"]
 
     def _extract_urls(self, text: str) -> List[str]:
         """Extract URLs from text"""
-        import re
-
-        urls = re.findall(
-            r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-            text,
-        )
-        return urls
+        return self._extract_entities(text)["urls"]
@@ -132,6 +132,8 @@ class RedditDataSource(DataSource):
                 if not full_text:
                     continue
 
+                entities = self._extract_entities(full_text)
+
                 # Create Post object
                 post = Post(
                     id=post_data["id"],
@@ -144,9 +146,9 @@ class RedditDataSource(DataSource):
                     source="reddit",
                     confidence_score=1.0,  # Will be set by bot detection
                     language="en",  # Reddit is primarily English
-                    hashtags=self._extract_hashtags(full_text),
-                    mentions=self._extract_mentions(full_text),
-                    urls=self._extract_urls(full_text),
+                    hashtags=entities["hashtags"],
+                    mentions=entities["mentions"],
+                    urls=entities["urls"],
                 )
 
                 posts.append(post)
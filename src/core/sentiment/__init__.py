@@ -1,7 +1,7 @@
+import importlib
+
 from .base import SentimentAnalyzer
-from .factory import SentimentAnalyzerFactory, default_analyzer
-from .textblob_analyzer import TextBlobAnalyzer
-from .vader_analyzer import VaderAnalyzer
+from .factory import SentimentAnalyzerFactory
 
 __all__ = [
     "SentimentAnalyzer",
@@ -10,3 +10,19 @@ __all__ = [
     "SentimentAnalyzerFactory",
     "default_analyzer",
 ]
+
+# Exports that pull in NLP backends, imported on first access
+_LAZY_EXPORTS = {
+    "TextBlobAnalyzer": ".textblob_analyzer",
+    "VaderAnalyzer": ".vader_analyzer",
+    "default_analyzer": ".factory",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -38,22 +38,48 @@ class SentimentAnalyzer(ABC):
         """
         texts = [post.text for post in posts]
         results = self.analyze_batch(texts)
+        analyzer_name = self.get_name()
 
         sentiment_results = []
-        for i, (post, result) in enumerate(zip(posts, results)):
+        for post, result in zip(posts, results):
             sentiment_result = SentimentResult(
                 post_id=post.id,
                 sentiment=result["sentiment"],
                 confidence=result["confidence"],
                 polarity=result["polarity"],
                 subjectivity=result["subjectivity"],
-                analyzer_used=self.get_name(),
+                analyzer_used=analyzer_name,
                 created_at=post.timestamp,
             )
             sentiment_results.append(sentiment_result)
 
         return sentiment_results
 
+    def _analyze_unique_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze each distinct text once and share the result across duplicates
+
+        Reposts and retweets often repeat the same text within a batch, so
+        scoring is done per unique text. Failed texts get a neutral result.
+        """
+        results_by_text: Dict[str, Dict[str, Any]] = {}
+        results = []
+        for text in texts:
+            if text not in results_by_text:
+                try:
+                    results_by_text[text] = self.analyze(text)
+                except Exception:
+                    # Fallback result for failed analysis
+                    results_by_text[text] = {
+                        "sentiment": SentimentType.NEUTRAL,
+                        "confidence": 0.0,
+                        "polarity": 0.0,
+                        "subjectivity": 0.0,
+                    }
+            results.append(dict(results_by_text[text]))
+
+        return results
+
     def _classify_sentiment(self, polarity: float) -> SentimentType:
         """
         Classify sentiment based on polarity score
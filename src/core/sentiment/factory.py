@@ -1,18 +1,30 @@
-from typing import Dict, Type
+import importlib
+from typing import Dict, Type, Union
 
 from .base import SentimentAnalyzer
-from .textblob_analyzer import TextBlobAnalyzer
-from .vader_analyzer import VaderAnalyzer
 
 
 class SentimentAnalyzerFactory:
     """Factory class for creating sentiment analyzers"""
 
-    _analyzers: Dict[str, Type[SentimentAnalyzer]] = {
-        "textblob": TextBlobAnalyzer,
-        "vader": VaderAnalyzer,
+    # Built-in analyzers are stored as "module:Class" paths and imported on
+    # first use, so their NLP backends are not loaded until needed
+    _analyzers: Dict[str, Union[str, Type[SentimentAnalyzer]]] = {
+        "textblob": "textblob_analyzer:TextBlobAnalyzer",
+        "vader": "vader_analyzer:VaderAnalyzer",
     }
 
+    @classmethod
+    def _resolve_analyzer_class(cls, name: str) -> Type[SentimentAnalyzer]:
+        """Get the analyzer class for a name, importing its module if needed"""
+        analyzer_class = cls._analyzers[name]
+        if isinstance(analyzer_class, str):
+            module_name, class_name = analyzer_class.split(":")
+            module = importlib.import_module(f".{module_name}", __package__)
+            analyzer_class = getattr(module, class_name)
+            cls._analyzers[name] = analyzer_class
+        return analyzer_class
+
     @classmethod
     def create_analyzer(cls, name: str = "textblob") -> SentimentAnalyzer:
         """
@@ -29,7 +41,7 @@ class SentimentAnalyzerFactory:
                 f"Unknown analyzer: {name}. Available: {list(cls._analyzers.keys())}"
             )
 
-        analyzer_class = cls._analyzers[name]
+        analyzer_class = cls._resolve_analyzer_class(name)
         return analyzer_class()
 
     @classmethod
@@ -43,5 +55,10 @@ class SentimentAnalyzerFactory:
         cls._analyzers[name] = analyzer_class
 
 
-# Default analyzer instance
-default_analyzer = SentimentAnalyzerFactory.create_analyzer("textblob")
+def __getattr__(name: str):
+    # Default analyzer instance, created on first access
+    if name == "default_analyzer":
+        analyzer = SentimentAnalyzerFactory.create_analyzer("textblob")
+        globals()[name] = analyzer
+        return analyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,8 +2,6 @@ from typing import Any, Dict, List
 
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-from src.models.schemas import SentimentType
-
 from .base import SentimentAnalyzer
 
 
@@ -41,20 +39,4 @@ class VaderAnalyzer(SentimentAnalyzer):
         """
         Analyze sentiment for multiple texts
         """
-        results = []
-        for text in texts:
-            try:
-                result = self.analyze(text)
-                results.append(result)
-            except Exception as e:
-                # Fallback result for failed analysis
-                results.append(
-                    {
-                        "sentiment": SentimentType.NEUTRAL,
-                        "confidence": 0.0,
-                        "polarity": 0.0,
-                        "subjectivity": 0.0,
-                    }
-                )
-
-        return results
+        return self._analyze_unique_texts(texts)
@@ -1,13 +1,17 @@
 import asyncio
+import logging
+import logging.handlers
+import queue
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.api.dashboard import router as dashboard_router
+from src.api.responses import DefaultJSONResponse
 from src.config import get_app_config, get_security_config
 from src.core.sentiment import SentimentAnalyzerFactory
 from src.models.schemas import (
@@ -18,10 +22,12 @@ from src.models.schemas import (
     SentimentResult,
     SentimentType,
 )
-from src.services.analysis_service import AnalysisService
-from src.services.cache_service import CacheService
-from src.services.config import get_service
-from src.services.data_source_service import DataSourceService
+from src.services.config import (
+    get_analysis_service,
+    get_cache_service,
+    get_data_source_service,
+    get_service,
+)
 from src.utils.database import DatabaseManager
 from src.utils.pagination import PaginatedResponse, paginate_results
 
@@ -29,23 +35,9 @@ from src.utils.pagination import PaginatedResponse, paginate_results
 config = get_app_config()
 security_config = get_security_config()
 
-app = FastAPI(
-    title="Interestify API",
-    description="Social media sentiment analysis API",
-    version=config.version,
-)
+router = APIRouter()
 
-# Add CORS middleware with configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=config.cors_origins,
-    allow_credentials=True,
-    allow_methods=config.cors_methods,
-    allow_headers=config.cors_headers,
-)
 
-# Add security headers middleware
-@app.middleware("http")
 async def add_security_headers(request, call_next):
     """Add security headers to all responses"""
     response = await call_next(request)
@@ -66,36 +58,77 @@ async def add_security_headers(request, call_next):
     
     return response
 
-# Include dashboard router
-app.include_router(dashboard_router)
+# Shared database manager from the DI container
+db_manager = get_service(DatabaseManager)
+
+# Background log listener, started on application startup
+log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so emitting never blocks the event loop
+
+    Returns:
+        Started QueueListener that writes records to the configured handlers
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    formatter = logging.Formatter(config.logging.format)
+
+    if config.logging.file_path:
+        handler: logging.Handler = logging.handlers.RotatingFileHandler(
+            config.logging.file_path,
+            maxBytes=config.logging.max_file_size_mb * 1024 * 1024,
+            backupCount=config.logging.backup_count,
+        )
+    else:
+        handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(config.logging.level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
-# Initialize database
-db_manager = DatabaseManager()
 
 # Get services from DI container
-analysis_service = get_service(AnalysisService)
-data_source_service = get_service(DataSourceService)
-cache_service = get_service(CacheService)
+analysis_service = get_analysis_service()
+data_source_service = get_data_source_service()
+cache_service = get_cache_service()
 
 
-@app.on_event("startup")
 async def startup_event():
     """Initialize application on startup"""
+    global log_listener
+    if log_listener is None:
+        log_listener = configure_logging()
+
     await db_manager.init_db()
 
     # Load configured data sources from repository via service
     await data_source_service.load_configurations_from_repository()
 
 
-@app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
+    global log_listener
     await data_source_service.close_all_sources()
     await db_manager.close()
 
+    if log_listener is not None:
+        log_listener.stop()
+        root_logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            if getattr(handler, "queue", None) is log_listener.queue:
+                root_logger.removeHandler(handler)
+        log_listener = None
+
 
 # Health check endpoint
-@app.get("/health")
+@router.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {
@@ -107,14 +140,14 @@ async def health_check():
 
 
 # Dashboard demo page
-@app.get("/dashboard")
+@router.get("/dashboard")
 async def dashboard_demo():
     """Serve dashboard demo page"""
     return FileResponse("dashboard_demo.html")
 
 
 # Search and analyze posts
-@app.post("/api/v1/analyze", response_model=AnalysisResult)
+@router.post("/api/v1/analyze", response_model=AnalysisResult)
 async def analyze_posts(
     query: SearchQuery,
     analyzer_name: str = Query(
@@ -157,7 +190,7 @@ async def analyze_posts(
 
 
 # Get posts from specific user
-@app.get("/api/v1/users/{user_id}/posts", response_model=List[Post])
+@router.get("/api/v1/users/{user_id}/posts", response_model=List[Post])
 async def get_user_posts(
     user_id: str,
     source: str = Query(..., description="Data source name"),
@@ -188,13 +221,13 @@ async def get_user_posts(
 
 
 # Data source management endpoints
-@app.get("/api/v1/datasources", response_model=List[Dict[str, Any]])
+@router.get("/api/v1/datasources", response_model=List[Dict[str, Any]])
 async def get_data_sources():
     """Get all configured data sources"""
     return data_source_service.get_all_sources()
 
 
-@app.post("/api/v1/datasources", response_model=Dict[str, str])
+@router.post("/api/v1/datasources", response_model=Dict[str, str])
 async def add_data_source(config: DataSourceConfig):
     """Add a new data source"""
     if await data_source_service.add_source(config):
@@ -203,7 +236,7 @@ async def add_data_source(config: DataSourceConfig):
         raise HTTPException(status_code=400, detail="Failed to add data source")
 
 
-@app.put("/api/v1/datasources/{name}", response_model=Dict[str, str])
+@router.put("/api/v1/datasources/{name}", response_model=Dict[str, str])
 async def update_data_source(name: str, config: DataSourceConfig):
     """Update data source configuration"""
     if await data_source_service.update_source(name, config):
@@ -212,7 +245,7 @@ async def update_data_source(name: str, config: DataSourceConfig):
         raise HTTPException(status_code=404, detail="Data source not found")
 
 
-@app.delete("/api/v1/datasources/{name}", response_model=Dict[str, str])
+@router.delete("/api/v1/datasources/{name}", response_model=Dict[str, str])
 async def remove_data_source(name: str):
     """Remove a data source"""
     if await data_source_service.remove_source(name):
@@ -222,13 +255,13 @@ async def remove_data_source(name: str):
 
 
 # Sentiment analyzer endpoints
-@app.get("/api/v1/analyzers", response_model=List[str])
+@router.get("/api/v1/analyzers", response_model=List[str])
 async def get_analyzers():
     """Get available sentiment analyzers"""
     return SentimentAnalyzerFactory.get_available_analyzers()
 
 
-@app.post("/api/v1/analyze-text", response_model=Dict[str, Any])
+@router.post("/api/v1/analyze-text", response_model=Dict[str, Any])
 async def analyze_text(
     text: str,
     analyzer_name: str = Query(
@@ -253,27 +286,63 @@ async def analyze_text(
 
 
 # Cache management endpoints
-@app.get("/api/v1/cache/stats", response_model=Dict[str, Any])
+@router.get("/api/v1/cache/stats", response_model=Dict[str, Any])
 async def get_cache_stats():
     """Get cache statistics"""
     return cache_service.get_stats()
 
 
-@app.delete("/api/v1/cache/clear", response_model=Dict[str, Any])
+@router.delete("/api/v1/cache/clear", response_model=Dict[str, Any])
 async def clear_cache():
     """Clear all cache entries"""
     cleared = cache_service.clear_all()
     return {"message": f"Cleared {cleared} cache entries"}
 
 
-@app.delete("/api/v1/cache/expired", response_model=Dict[str, Any])
+@router.delete("/api/v1/cache/expired", response_model=Dict[str, Any])
 async def clear_expired_cache():
     """Clear expired cache entries"""
     cleared = cache_service.clear_expired()
     return {"message": f"Cleared {cleared} expired cache entries"}
 
 
+def create_app(*, enable_middleware: bool = True) -> FastAPI:
+    """
+    Build the FastAPI application
+
+    Args:
+        enable_middleware: Whether to install the CORS and security header
+            middleware; tests that only exercise route handlers can skip it
+
+    Returns:
+        Configured FastAPI application
+    """
+    application = FastAPI(
+        title="Interestify API",
+        description="Social media sentiment analysis API",
+        version=config.version,
+        default_response_class=DefaultJSONResponse,
+    )
+
+    if enable_middleware:
+        # Add CORS middleware with configuration
+        application.add_middleware(
+            CORSMiddleware,
+            allow_origins=config.cors_origins,
+            allow_credentials=True,
+            allow_methods=config.cors_methods,
+            allow_headers=config.cors_headers,
+        )
+        application.middleware("http")(add_security_headers)
+
+    application.include_router(dashboard_router)
+    application.include_router(router)
+    application.add_event_handler("startup", startup_event)
+    application.add_event_handler("shutdown", shutdown_event)
+    return application
+
 
+app = create_app()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,16 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 
@@ -25,6 +35,11 @@ class PostTable(Base):
     urls = Column(JSON, default=list)
     created_at = Column(DateTime, default=func.now())
 
+    __table_args__ = (
+        Index("ix_posts_timestamp", timestamp.desc()),
+        Index("ix_posts_source_timestamp", source, timestamp.desc()),
+    )
+
 
 class SentimentResultTable(Base):
     __tablename__ = "sentiment_results"
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SentimentType(str, Enum):
@@ -20,6 +20,8 @@ class EngagementStats(BaseModel):
 
 
 class Post(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     text: str
     timestamp: datetime
@@ -60,6 +62,8 @@ class SearchQuery(BaseModel):
 
 
 class DataSourceConfig(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     name: str
     enabled: bool = True
     api_key: Optional[str] = None
@@ -66,8 +66,8 @@ class DatabaseAnalysisRepository(AnalysisRepository):
             # Delegate to existing database manager method
             await self.db_manager.store_analysis_result(result)
             return True
-        except Exception as e:
-            logger.error(f"Error saving analysis result: {e}")
+        except Exception:
+            logger.exception("Error saving analysis result")
             return False
     
     async def get_analysis_result(self, query: str, created_after: Optional[datetime] = None) -> Optional[AnalysisResult]:
@@ -76,20 +76,17 @@ class DatabaseAnalysisRepository(AnalysisRepository):
             # This would need to be implemented in DatabaseManager
             # For now, return None to maintain existing behavior
             return None
-        except Exception as e:
-            print(f"Error retrieving analysis result: {e}")
+        except Exception:
+            logger.exception("Error retrieving analysis result")
             return None
     
     async def save_posts(self, posts: List[Post]) -> bool:
         """Save posts to database"""
         try:
-            # Batch save posts - would need to be implemented in DatabaseManager
-            # For now, save individually
-            for post in posts:
-                await self.db_manager.store_post(post)
-            return True
-        except Exception as e:
-            print(f"Error saving posts: {e}")
+            # Write the whole batch in one transaction
+            return await self.db_manager.store_posts(posts)
+        except Exception:
+            logger.exception("Error saving posts")
             return False
     
     async def get_posts_by_source(self, source: str, limit: int = 50) -> List[Post]:
@@ -97,19 +94,17 @@ class DatabaseAnalysisRepository(AnalysisRepository):
         try:
             # This would need to be implemented in DatabaseManager
             return []
-        except Exception as e:
-            print(f"Error retrieving posts: {e}")
+        except Exception:
+            logger.exception("Error retrieving posts")
             return []
     
     async def save_sentiment_results(self, results: List[SentimentResult]) -> bool:
         """Save sentiment analysis results to database"""
         try:
-            # Batch save sentiment results
-            for result in results:
-                await self.db_manager.store_sentiment_result(result)
-            return True
-        except Exception as e:
-            print(f"Error saving sentiment results: {e}")
+            # Write the whole batch in one transaction
+            return await self.db_manager.store_sentiment_results(results)
+        except Exception:
+            logger.exception("Error saving sentiment results")
             return False
     
     async def get_sentiment_results_by_post_ids(self, post_ids: List[str]) -> List[SentimentResult]:
@@ -117,8 +112,8 @@ class DatabaseAnalysisRepository(AnalysisRepository):
         try:
             # This would need to be implemented in DatabaseManager
             return []
-        except Exception as e:
-            print(f"Error retrieving sentiment results: {e}")
+        except Exception:
+            logger.exception("Error retrieving sentiment results")
             return []
     
     async def cleanup_old_data(self, older_than_days: int = 30) -> int:
@@ -126,6 +121,6 @@ class DatabaseAnalysisRepository(AnalysisRepository):
         try:
             # This would need to be implemented in DatabaseManager
             return 0
-        except Exception as e:
-            print(f"Error cleaning up old data: {e}")
+        except Exception:
+            logger.exception("Error cleaning up old data")
             return 0
\ No newline at end of file
@@ -59,8 +59,8 @@ class DatabaseDataSourceRepository(DataSourceRepository):
         try:
             await self.db_manager.save_data_source_config(config)
             return True
-        except Exception as e:
-            logger.error(f"Error saving data source config: {e}")
+        except Exception:
+            logger.exception("Error saving data source config")
             return False
     
     async def get_config(self, name: str) -> Optional[DataSourceConfig]:
@@ -71,16 +71,16 @@ class DatabaseDataSourceRepository(DataSourceRepository):
                 if config.name == name:
                     return config
             return None
-        except Exception as e:
-            print(f"Error retrieving data source config: {e}")
+        except Exception:
+            logger.exception("Error retrieving data source config")
             return None
     
     async def get_all_configs(self) -> List[DataSourceConfig]:
         """Get all data source configurations from database"""
         try:
             return await self.db_manager.get_all_data_source_configs()
-        except Exception as e:
-            print(f"Error retrieving all data source configs: {e}")
+        except Exception:
+            logger.exception("Error retrieving all data source configs")
             return []
     
     async def update_config(self, name: str, config: DataSourceConfig) -> bool:
@@ -88,8 +88,8 @@ class DatabaseDataSourceRepository(DataSourceRepository):
         try:
             await self.db_manager.update_data_source_config(name, config)
             return True
-        except Exception as e:
-            print(f"Error updating data source config: {e}")
+        except Exception:
+            logger.exception("Error updating data source config")
             return False
     
     async def delete_config(self, name: str) -> bool:
@@ -97,8 +97,8 @@ class DatabaseDataSourceRepository(DataSourceRepository):
         try:
             await self.db_manager.delete_data_source_config(name)
             return True
-        except Exception as e:
-            print(f"Error deleting data source config: {e}")
+        except Exception:
+            logger.exception("Error deleting data source config")
             return False
     
     async def get_enabled_configs(self) -> List[DataSourceConfig]:
@@ -106,6 +106,6 @@ class DatabaseDataSourceRepository(DataSourceRepository):
         try:
             all_configs = await self.get_all_configs()
             return [config for config in all_configs if config.enabled]
-        except Exception as e:
-            print(f"Error retrieving enabled data source configs: {e}")
+        except Exception:
+            logger.exception("Error retrieving enabled data source configs")
             return []
\ No newline at end of file
@@ -7,9 +7,10 @@ and result aggregation. Now uses repository pattern for data access.
 
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from src.core.datasources.manager import DataSourceManager
+from src.core.sentiment.base import SentimentAnalyzer
 from src.core.sentiment.factory import SentimentAnalyzerFactory
 from src.models.schemas import AnalysisResult, SearchQuery, SentimentType
 from src.repositories.analysis_repository import AnalysisRepository
@@ -22,6 +23,15 @@ class AnalysisService:
     def __init__(self, data_source_manager: DataSourceManager, analysis_repository: AnalysisRepository):
         self.data_source_manager = data_source_manager
         self.analysis_repository = analysis_repository
+        self._analyzers: Dict[str, SentimentAnalyzer] = {}
+    
+    def _get_analyzer(self, analyzer_name: str) -> SentimentAnalyzer:
+        """Get a sentiment analyzer by name, creating it only on first use"""
+        if analyzer_name not in self._analyzers:
+            self._analyzers[analyzer_name] = SentimentAnalyzerFactory.create_analyzer(
+                analyzer_name
+            )
+        return self._analyzers[analyzer_name]
     
     async def analyze_posts(
         self,
@@ -51,9 +61,10 @@ class AnalysisService:
         # Filter sources based on query
         sources_to_use = enabled_sources
         if query.data_sources:
+            allowed_sources = frozenset(query.data_sources)
             sources_to_use = [
                 source for source in enabled_sources 
-                if source.name in query.data_sources
+                if source.name in allowed_sources
             ]
         
         # Collect posts from all sources
@@ -76,7 +87,7 @@ class AnalysisService:
         sentiment_results = []
         if query.include_sentiment:
             try:
-                analyzer = SentimentAnalyzerFactory.create_analyzer(analyzer_name)
+                analyzer = self._get_analyzer(analyzer_name)
                 sentiment_results = analyzer.process_posts(paginated_posts)
                 
                 # Save sentiment results to repository
@@ -174,7 +185,7 @@ class AnalysisService:
             Sentiment analysis result
         """
         try:
-            analyzer = SentimentAnalyzerFactory.create_analyzer(analyzer_name)
+            analyzer = self._get_analyzer(analyzer_name)
             result = analyzer.analyze(text)
             return result
         except Exception as e:
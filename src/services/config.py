@@ -5,9 +5,13 @@ This module sets up the dependency injection container and configures
 all application services and repositories.
 """
 
-from src.core.cache import cache_manager
+import functools
+from typing import Optional
+
+from src.config import get_app_config
+from src.core.cache import CacheManager, cache_manager
 from src.core.container import container
-from src.core.datasources import data_source_manager
+from src.core.datasources import DataSourceManager, data_source_manager
 from src.repositories.analysis_repository import AnalysisRepository, DatabaseAnalysisRepository
 from src.repositories.data_source_repository import DataSourceRepository, DatabaseDataSourceRepository
 from src.services.analysis_service import AnalysisService
@@ -15,16 +19,41 @@ from src.services.cache_service import CacheService
 from src.services.data_source_service import DataSourceService
 from src.utils.database import DatabaseManager
 
+# Set once configure_services has populated the container
+_configured = False
+
 
 def configure_services():
     """Configure all application services and repositories in the DI container"""
+    global _configured
+    if _configured:
+        return
     
+    try:
+        _register_services()
+    except Exception:
+        # Leave nothing half-registered so the next call retries from scratch
+        container.clear()
+        raise
+    _configured = True
+
+
+def _register_services():
+    """Register every service and repository in the DI container"""
     # Register existing managers as singletons
-    container.register_singleton(type(data_source_manager), data_source_manager)
-    container.register_singleton(type(cache_manager), cache_manager)
+    container.register_singleton(DataSourceManager, data_source_manager)
+    container.register_singleton(CacheManager, cache_manager)
     
-    # Register database manager factory
-    container.register_factory(DatabaseManager, lambda: DatabaseManager())
+    # Register a single database manager so the engine and its pool are shared
+    database_config = get_app_config().database
+    container.register_singleton(
+        DatabaseManager,
+        DatabaseManager(
+            database_config.url,
+            pool_size=database_config.pool_size,
+            max_overflow=database_config.max_overflow,
+        )
+    )
     
     # Register repositories
     container.register_factory(
@@ -37,33 +66,69 @@ def configure_services():
         lambda: DatabaseDataSourceRepository(container.get(DatabaseManager))
     )
     
-    # Register services
-    container.register_factory(
+    # Register services as singletons so their per-instance state is kept
+    container.register_singleton(
         AnalysisService,
-        lambda: AnalysisService(
-            container.get(type(data_source_manager)),
+        AnalysisService(
+            container.get(DataSourceManager),
             container.get(AnalysisRepository)
         )
     )
     
-    container.register_factory(
+    container.register_singleton(
         DataSourceService,
-        lambda: DataSourceService(
-            container.get(type(data_source_manager)),
+        DataSourceService(
+            container.get(DataSourceManager),
             container.get(DataSourceRepository)
         )
     )
     
-    container.register_factory(
+    container.register_singleton(
         CacheService,
-        lambda: CacheService(container.get(type(cache_manager)))
+        CacheService(container.get(CacheManager))
     )
 
 
+def reset_services() -> Optional[DatabaseManager]:
+    """
+    Clear all registrations so the next lookup configures fresh services
+
+    The previously registered DatabaseManager is returned, not closed;
+    the caller owns it and should await its close() to dispose the engine.
+    """
+    global _configured
+    db_manager = container.get_or_none(DatabaseManager) if _configured else None
+    container.clear()
+    _configured = False
+    get_analysis_service.cache_clear()
+    get_data_source_service.cache_clear()
+    get_cache_service.cache_clear()
+    return db_manager
+
+
 def get_service(service_type):
     """Get a service instance from the container"""
+    configure_services()
     return container.get(service_type)
 
 
+@functools.lru_cache(maxsize=1)
+def get_analysis_service() -> AnalysisService:
+    """Get the shared analysis service"""
+    return get_service(AnalysisService)
+
+
+@functools.lru_cache(maxsize=1)
+def get_data_source_service() -> DataSourceService:
+    """Get the shared data source service"""
+    return get_service(DataSourceService)
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache_service() -> CacheService:
+    """Get the shared cache service"""
+    return get_service(CacheService)
+
+
 # Initialize services on module import
 configure_services()
\ No newline at end of file
@@ -5,7 +5,9 @@ Handles data source management operations including registration,
 configuration, and lifecycle management. Now uses repository pattern for persistence.
 """
 
-from typing import Any, Dict, List
+import copy
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.datasources.manager import DataSourceManager
 from src.models.schemas import DataSourceConfig
@@ -15,12 +17,31 @@ from src.repositories.data_source_repository import DataSourceRepository
 class DataSourceService:
     """Service for managing data sources"""
     
+    # Seconds a get_all_sources snapshot is reused before being rebuilt
+    SOURCES_CACHE_TTL = 2.0
+    
     def __init__(self, data_source_manager: DataSourceManager, data_source_repository: DataSourceRepository):
         self.data_source_manager = data_source_manager
         self.data_source_repository = data_source_repository
+        self._sources_cache: Tuple[float, Optional[List[Dict[str, Any]]]] = (0.0, None)
+        self._configurations_loaded = False
+    
+    def _invalidate_sources_cache(self):
+        """Drop the cached get_all_sources snapshot"""
+        self._sources_cache = (0.0, None)
     
     def get_all_sources(self) -> List[Dict[str, Any]]:
-        """Get all configured data sources with their status"""
+        """
+        Get all configured data sources with their status
+        
+        Each call returns its own copy of the cached snapshot, so callers
+        may modify the result freely.
+        """
+        now = time.monotonic()
+        cached_at, cached_sources = self._sources_cache
+        if cached_sources is not None and now - cached_at < self.SOURCES_CACHE_TTL:
+            return copy.deepcopy(cached_sources)
+        
         sources = []
         for name in self.data_source_manager.get_configured_sources():
             source = self.data_source_manager.get_data_source(name)
@@ -31,7 +52,8 @@ class DataSourceService:
                 "rate_limit": source.config.rate_limit,
                 "rate_limit_info": source.get_rate_limit_info(),
             })
-        return sources
+        self._sources_cache = (now, sources)
+        return copy.deepcopy(sources)
     
     async def add_source(self, config: DataSourceConfig) -> bool:
         """
@@ -45,6 +67,7 @@ class DataSourceService:
         """
         # Add to manager first
         if self.data_source_manager.add_data_source(config):
+            self._invalidate_sources_cache()
             # Save to repository
             await self.data_source_repository.save_config(config)
             return True
@@ -63,6 +86,7 @@ class DataSourceService:
         """
         # Update in manager first
         if self.data_source_manager.update_source_config(name, config):
+            self._invalidate_sources_cache()
             # Update in repository
             await self.data_source_repository.update_config(name, config)
             return True
@@ -80,6 +104,7 @@ class DataSourceService:
         """
         # Remove from manager first
         if self.data_source_manager.remove_data_source(name):
+            self._invalidate_sources_cache()
             # Remove from repository
             await self.data_source_repository.delete_config(name)
             return True
@@ -97,11 +122,24 @@ class DataSourceService:
         """Close all data source connections"""
         await self.data_source_manager.close_all()
     
-    async def load_configurations_from_repository(self):
-        """Load all data source configurations from repository"""
+    async def load_configurations_from_repository(self, force: bool = False):
+        """
+        Load all data source configurations from repository
+        
+        Configurations are loaded once per process; afterwards the manager
+        holds them in memory and is kept in sync by add/update/remove.
+        
+        Args:
+            force: Reload even if configurations were already loaded
+        """
+        if self._configurations_loaded and not force:
+            return
+        
         configs = await self.data_source_repository.get_all_configs()
         for config in configs:
             self.data_source_manager.add_data_source(config)
+        self._configurations_loaded = True
+        self._invalidate_sources_cache()
     
     async def get_enabled_configurations(self) -> List[DataSourceConfig]:
         """Get all enabled data source configurations from repository"""
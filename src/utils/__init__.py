@@ -1,9 +1,15 @@
 from .database import DatabaseManager
-from .pagination import PaginatedResponse, create_paginated_response, paginate_results
+from .pagination import (
+    PaginatedResponse,
+    create_paginated_response,
+    paginate_iter,
+    paginate_results,
+)
 
 __all__ = [
     "PaginatedResponse",
     "paginate_results",
+    "paginate_iter",
     "create_paginated_response",
     "DatabaseManager",
 ]
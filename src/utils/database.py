@@ -1,10 +1,29 @@
 import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import (
+    and_,
+    create_engine,
+    event,
+    func,
+    insert,
+    literal_column,
+    make_url,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.sql import Select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from src.models.database import (
     Base,
@@ -12,132 +31,467 @@ from src.models.database import (
     PostTable,
     SentimentResultTable,
 )
-from src.models.schemas import AnalysisResult, DataSourceConfig, Post, SentimentResult
+from src.models.schemas import (
+    AnalysisResult,
+    DataSourceConfig,
+    EngagementStats,
+    Post,
+    SentimentResult,
+)
+from src.utils.pagination import PaginatedResponse, create_paginated_response
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library encoder
+    orjson = None
+
+
+def _json_serializer(value) -> str:
+    """Serialize a JSON column value"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _json_deserializer(value):
+    """Parse a stored JSON column value"""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+# Pragmas applied to every new SQLite connection: WAL lets readers proceed
+# during writes and NORMAL sync skips the per-commit fsync of the WAL
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Pragmas for databases whose contents may be lost (in-memory or durable=False):
+# no journal file and no fsync at all
+SQLITE_EPHEMERAL_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Seconds a data source config read is served from memory
+CONFIG_CACHE_TTL = 60.0
+
+# Seconds a get_posts_by_query result is served from memory
+POSTS_CACHE_TTL = 30.0
+
+# Maximum number of distinct (query, limit) results kept in memory
+POSTS_CACHE_SIZE = 256
+
+# Config cache key holding the result of get_all_data_source_configs
+_ALL_CONFIGS_KEY = object()
+
+# Post fields stored as columns of the posts table
+POST_COLUMNS = frozenset(
+    column.name for column in PostTable.__table__.columns if column.name != "created_at"
+)
+
+# SentimentResult fields stored in the sentiment_results table
+SENTIMENT_COLUMNS = frozenset(
+    column.name
+    for column in SentimentResultTable.__table__.columns
+    if column.name not in ("id", "created_at")
+)
+
+# Fields of an AnalysisResult written by store_analysis_result, for one model_dump
+ANALYSIS_ROW_FIELDS = {
+    "posts": {"__all__": POST_COLUMNS},
+    "sentiment_results": {"__all__": SENTIMENT_COLUMNS},
+}
+
+# Rebuild posts_fts from the posts table. posts has a TEXT primary key, so
+# the index is keyed on its implicit rowid, which VACUUM may renumber; run
+# this (see DatabaseManager.vacuum) after a VACUUM or any rewrite of posts
+_POSTS_FTS_REBUILD_SQL = text("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+
+# Full-text index over posts.text kept in sync by triggers. The trigram
+# tokenizer matches arbitrary substrings, like the LIKE '%query%' it replaces
+POSTS_FTS_DDL = tuple(
+    text(statement)
+    for statement in (
+        "CREATE VIRTUAL TABLE posts_fts USING fts5("
+        "text, content='posts', content_rowid='rowid', tokenize='trigram')",
+        "CREATE TRIGGER posts_fts_insert AFTER INSERT ON posts BEGIN "
+        "INSERT INTO posts_fts(rowid, text) VALUES (new.rowid, new.text); END",
+        "CREATE TRIGGER posts_fts_delete AFTER DELETE ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, text) "
+        "VALUES ('delete', old.rowid, old.text); END",
+        "CREATE TRIGGER posts_fts_update AFTER UPDATE OF text ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, text) "
+        "VALUES ('delete', old.rowid, old.text); "
+        "INSERT INTO posts_fts(rowid, text) VALUES (new.rowid, new.text); END",
+    )
+) + (_POSTS_FTS_REBUILD_SQL,)
+
+_POSTS_FTS_EXISTS_SQL = text(
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+)
+
+_POSTS_FTS = text("posts_fts")
+
+# Raw statements for data source configs, built once at import
+_UPDATE_CONFIG_SQL = text(
+    """
+    UPDATE data_source_configs
+    SET enabled = :enabled, api_key = :api_key, api_secret = :api_secret,
+        rate_limit = :rate_limit, timeout = :timeout, cache_ttl = :cache_ttl,
+        bot_detection_threshold = :bot_detection_threshold,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE name = :name
+"""
+)
+
+_DELETE_CONFIG_SQL = text("DELETE FROM data_source_configs WHERE name = :name")
+
+# Trigram queries need at least this many characters to match anything
+FTS_MIN_QUERY_LENGTH = 3
+
+# Columns selected when reading rows straight into models. Rows come from
+# our own writes, so models are built with model_construct (no validation)
+CONFIG_SELECT_COLUMNS = tuple(
+    DataSourceConfigTable.__table__.c[field] for field in DataSourceConfig.model_fields
+)
+POST_SELECT_COLUMNS = tuple(
+    PostTable.__table__.c[column] for column in sorted(POST_COLUMNS)
+)
+
+
+def _config_from_row(row) -> DataSourceConfig:
+    """Build a DataSourceConfig from a selected row mapping"""
+    return DataSourceConfig.model_construct(**row)
+
+
+def _post_from_row(row) -> Post:
+    """Build a Post from a selected row mapping"""
+    values = dict(row)
+    values["engagement_stats"] = EngagementStats.model_construct(
+        **values["engagement_stats"]
+    )
+    return Post.model_construct(**values)
+
+
+class PendingAnalysisWrite(NamedTuple):
+    """Table rows for an analysis result, prepared but not yet written"""
+
+    post_rows: List[dict]
+    sentiment_rows: List[dict]
 
 
 class DatabaseManager:
     """Database manager for storing and retrieving data"""
 
-    def __init__(self, database_url: str = "sqlite+aiosqlite:///./interestify.db"):
+    def __init__(
+        self,
+        database_url: str = "sqlite+aiosqlite:///./interestify.db",
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        durable: bool = True,
+    ):
+        url = make_url(database_url)
+        if url.drivername == "sqlite":
+            # Plain sqlite:// URLs name the sync driver; use its async twin
+            url = url.set(drivername="sqlite+aiosqlite")
+            database_url = url.render_as_string(hide_password=False)
         self.database_url = database_url
-        self.engine = create_async_engine(database_url)
+        is_sqlite = url.get_backend_name() == "sqlite"
+        is_memory = is_sqlite and url.database in (None, "", ":memory:")
+        engine_options = {}
+        if is_memory:
+            # Every session must share the one connection holding the database
+            engine_options["poolclass"] = StaticPool
+        else:
+            # Keep a pool of open connections to reuse; file-backed SQLite
+            # otherwise defaults to opening a new connection per session
+            if is_sqlite:
+                engine_options["poolclass"] = AsyncAdaptedQueuePool
+            engine_options["pool_size"] = pool_size
+            engine_options["max_overflow"] = max_overflow
+            engine_options["pool_pre_ping"] = True
+            engine_options["pool_recycle"] = 1800
+        # Larger compiled-statement cache so every ORM query shape stays cached
+        self.engine = create_async_engine(
+            database_url,
+            query_cache_size=1200,
+            json_serializer=_json_serializer,
+            json_deserializer=_json_deserializer,
+            **engine_options,
+        )
+        if is_sqlite:
+            self._sqlite_pragmas = (
+                SQLITE_PRAGMAS
+                if durable and not is_memory
+                else SQLITE_EPHEMERAL_PRAGMAS
+            )
+            event.listen(self.engine.sync_engine, "connect", self._apply_sqlite_pragmas)
         self.SessionLocal = sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
+        # Data source config reads keyed by name (or _ALL_CONFIGS_KEY)
+        self._config_cache: Dict[object, Tuple[float, object]] = {}
+        # get_posts_by_query results keyed by (query, limit), oldest first
+        self._posts_cache: Dict[Tuple[str, int], Tuple[float, List[Post]]] = {}
+        # Set by init_db once the posts_fts index is known to exist
+        self._fts_enabled = False
+
+    def _apply_sqlite_pragmas(self, dbapi_connection, connection_record):
+        """Tune a new SQLite connection"""
+        cursor = dbapi_connection.cursor()
+        for pragma in self._sqlite_pragmas:
+            cursor.execute(pragma)
+        cursor.close()
 
     async def init_db(self):
         """Initialize database tables"""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+        if self.engine.dialect.name == "sqlite":
+            self._fts_enabled = await self._init_posts_fts()
+            # Refresh planner statistics so the posts indexes get used
+            async with self.engine.begin() as conn:
+                await conn.exec_driver_sql("ANALYZE")
+
+    async def _init_posts_fts(self) -> bool:
+        """Create the posts full-text index if needed, returning whether it exists"""
+        try:
+            async with self.engine.begin() as conn:
+                exists = await conn.scalar(_POSTS_FTS_EXISTS_SQL)
+                if not exists:
+                    for statement in POSTS_FTS_DDL:
+                        await conn.execute(statement)
+            return True
+        except OperationalError as e:
+            # SQLite built without FTS5 or the trigram tokenizer
+            logger.warning("Full-text search unavailable, using LIKE: %s", e)
+            return False
+
+    async def rebuild_posts_fts(self) -> bool:
+        """Rebuild the posts full-text index from the posts table"""
+        if not self._fts_enabled:
+            return False
+        try:
+            async with self.engine.begin() as conn:
+                await conn.execute(_POSTS_FTS_REBUILD_SQL)
+            return True
+        except Exception:
+            logger.exception("Error rebuilding posts full-text index")
+            return False
+
+    async def vacuum(self) -> bool:
+        """
+        Compact the database file and resync the posts full-text index
+
+        VACUUM may renumber the implicit rowids the full-text index is keyed
+        on, so the index is rebuilt afterwards.
+        """
+        try:
+            async with self.engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await conn.exec_driver_sql("VACUUM")
+        except Exception:
+            logger.exception("Error vacuuming database")
+            return False
+        if self._fts_enabled:
+            return await self.rebuild_posts_fts()
+        return True
 
     def get_session(self) -> AsyncSession:
         """Get database session"""
         return self.SessionLocal()
 
+    @asynccontextmanager
+    async def begin_transaction(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open a session whose writes commit together when the block exits
+
+        Pass the session to write methods that accept one; an exception
+        inside the block rolls every write back.
+        """
+        async with self.get_session() as session:
+            async with session.begin():
+                yield session
+        # Reads made before the commit may have cached the old rows
+        self._invalidate_config_cache()
+        self._posts_cache.clear()
+
+    @asynccontextmanager
+    async def bulk_ingest(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open a transaction for a large load with the posts indexes dropped
+
+        The secondary posts indexes are rebuilt in one pass when the block
+        exits instead of being updated row by row. The rebuild scans the
+        whole table, so use this for big batches rather than routine writes.
+        """
+        async with self.begin_transaction() as session:
+            conn = await session.connection()
+            indexes = list(PostTable.__table__.indexes)
+            for index in indexes:
+                await conn.run_sync(index.drop, checkfirst=True)
+            yield session
+            for index in indexes:
+                await conn.run_sync(index.create)
+
     async def close(self):
         """Close database connection"""
         await self.engine.dispose()
 
     # Data source configuration methods
-    async def save_data_source_config(self, config: DataSourceConfig) -> bool:
+    def _get_cached_config(self, key: object):
+        """Get a cached config read, or None if missing or expired"""
+        entry = self._config_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, value = entry
+        if time.monotonic() - cached_at >= CONFIG_CACHE_TTL:
+            del self._config_cache[key]
+            return None
+        return value
+
+    def _cache_config(self, key: object, value: object):
+        """Remember a config read"""
+        self._config_cache[key] = (time.monotonic(), value)
+
+    def _invalidate_config_cache(self):
+        """Drop cached config reads after a write"""
+        self._config_cache.clear()
+
+    async def save_data_source_config(
+        self, config: DataSourceConfig, session: Optional[AsyncSession] = None
+    ) -> bool:
         """Save or update data source configuration (upsert)"""
+        return await self.save_data_source_configs([config], session=session)
+
+    async def save_data_source_configs(
+        self, configs: List[DataSourceConfig], session: Optional[AsyncSession] = None
+    ) -> bool:
+        """
+        Save or update several data source configurations in one transaction
+
+        With a session from begin_transaction the rows are written in the
+        caller's transaction and errors propagate so it can roll back.
+        """
+        config_rows = [config.model_dump() for config in configs]
+        if session is not None:
+            await self._upsert_config_rows(session, config_rows)
+            self._invalidate_config_cache()
+            return True
+
         try:
             async with self.get_session() as session:
-                # Check if config exists
-                result = await session.execute(
-                    text("SELECT * FROM data_source_configs WHERE name = :name"),
-                    {"name": config.name},
-                )
-                row = result.fetchone()
-                if row:
-                    # Update existing config
-                    await session.execute(
-                        text(
-                            """
-                            UPDATE data_source_configs SET enabled=:enabled, api_key=:api_key, api_secret=:api_secret, rate_limit=:rate_limit, timeout=:timeout, cache_ttl=:cache_ttl, bot_detection_threshold=:bot_detection_threshold, updated_at=CURRENT_TIMESTAMP WHERE name=:name
-                            """
-                        ),
-                        {
-                            "enabled": config.enabled,
-                            "api_key": config.api_key,
-                            "api_secret": config.api_secret,
-                            "rate_limit": config.rate_limit,
-                            "timeout": config.timeout,
-                            "cache_ttl": config.cache_ttl,
-                            "bot_detection_threshold": config.bot_detection_threshold,
-                            "name": config.name,
-                        },
-                    )
-                else:
-                    db_config = DataSourceConfigTable(
-                        name=config.name,
-                        enabled=config.enabled,
-                        api_key=config.api_key,
-                        api_secret=config.api_secret,
-                        rate_limit=config.rate_limit,
-                        timeout=config.timeout,
-                        cache_ttl=config.cache_ttl,
-                        bot_detection_threshold=config.bot_detection_threshold,
-                    )
-                    session.add(db_config)
+                await self._upsert_config_rows(session, config_rows)
                 await session.commit()
+                self._invalidate_config_cache()
                 return True
-        except Exception as e:
-            print(f"Error saving data source config: {e}")
+        except Exception:
+            logger.exception("Error saving data source configs")
             return False
 
+    async def _upsert_config_rows(self, session: AsyncSession, config_rows: List[dict]):
+        """Insert data source config rows, updating any that already exist"""
+        if not config_rows:
+            return
+
+        if self.engine.dialect.name != "sqlite":
+            for values in config_rows:
+                result = await session.execute(
+                    select(DataSourceConfigTable).where(
+                        DataSourceConfigTable.name == values["name"]
+                    )
+                )
+                db_config = result.scalar_one_or_none()
+                if db_config is None:
+                    session.add(DataSourceConfigTable(**values))
+                else:
+                    for column, value in values.items():
+                        setattr(db_config, column, value)
+            return
+
+        # One executemany INSERT ... ON CONFLICT instead of SELECT then write
+        statement = sqlite_insert(DataSourceConfigTable)
+        statement = statement.on_conflict_do_update(
+            index_elements=[DataSourceConfigTable.name],
+            set_={
+                **{
+                    column: statement.excluded[column]
+                    for column in config_rows[0]
+                    if column != "name"
+                },
+                "updated_at": func.current_timestamp(),
+            },
+        )
+        await session.execute(statement, config_rows)
+
     async def get_data_source_config(self, name: str) -> Optional[DataSourceConfig]:
         """Get data source configuration by name"""
+        cached_config = self._get_cached_config(name)
+        if cached_config is not None:
+            # DataSourceConfig has only immutable fields, so a shallow copy
+            # cannot share state with the cached model
+            return cached_config.model_copy()
+
         try:
             async with self.get_session() as session:
                 result = await session.execute(
-                    text("SELECT * FROM data_source_configs WHERE name = :name"),
-                    {"name": name},
+                    select(*CONFIG_SELECT_COLUMNS).where(
+                        DataSourceConfigTable.name == name
+                    )
                 )
-                row = result.fetchone()
+                row = result.mappings().one_or_none()
 
                 if row:
-                    return DataSourceConfig(
-                        name=row.name,
-                        enabled=row.enabled,
-                        api_key=row.api_key,
-                        api_secret=row.api_secret,
-                        rate_limit=row.rate_limit,
-                        timeout=row.timeout,
-                        cache_ttl=row.cache_ttl,
-                        bot_detection_threshold=row.bot_detection_threshold,
-                    )
+                    config = _config_from_row(row)
+                    self._cache_config(name, config)
+                    return config.model_copy()
                 return None
-        except Exception as e:
-            print(f"Error getting data source config: {e}")
+        except Exception:
+            logger.exception("Error getting data source config")
             return None
 
-    async def get_all_data_source_configs(self) -> List[DataSourceConfig]:
-        """Get all data source configurations"""
+    async def exists_data_source_config(self, name: str) -> bool:
+        """Check whether a data source configuration exists without loading it"""
+        if self._get_cached_config(name) is not None:
+            return True
+
         try:
             async with self.get_session() as session:
                 result = await session.execute(
-                    text("SELECT * FROM data_source_configs")
+                    select(literal_column("1"))
+                    .where(DataSourceConfigTable.name == name)
+                    .limit(1)
                 )
-                rows = result.fetchall()
-
-                configs = []
-                for row in rows:
-                    config = DataSourceConfig(
-                        name=row.name,
-                        enabled=row.enabled,
-                        api_key=row.api_key,
-                        api_secret=row.api_secret,
-                        rate_limit=row.rate_limit,
-                        timeout=row.timeout,
-                        cache_ttl=row.cache_ttl,
-                        bot_detection_threshold=row.bot_detection_threshold,
-                    )
-                    configs.append(config)
+                return result.scalar() is not None
+        except Exception:
+            logger.exception("Error checking data source config")
+            return False
+
+    async def get_all_data_source_configs(self) -> List[DataSourceConfig]:
+        """Get all data source configurations"""
+        cached_configs = self._get_cached_config(_ALL_CONFIGS_KEY)
+        if cached_configs is not None:
+            return [config.model_copy() for config in cached_configs]
 
-                return configs
-        except Exception as e:
-            print(f"Error getting all data source configs: {e}")
+        try:
+            async with self.get_session() as session:
+                result = await session.execute(select(*CONFIG_SELECT_COLUMNS))
+                configs = [_config_from_row(row) for row in result.mappings()]
+                self._cache_config(_ALL_CONFIGS_KEY, configs)
+                return [config.model_copy() for config in configs]
+        except Exception:
+            logger.exception("Error getting all data source configs")
             return []
 
     async def update_data_source_config(
@@ -147,15 +501,7 @@ class DatabaseManager:
         try:
             async with self.get_session() as session:
                 await session.execute(
-                    text(
-                        """
-                        UPDATE data_source_configs 
-                        SET enabled = :enabled, api_key = :api_key, api_secret = :api_secret,
-                            rate_limit = :rate_limit, timeout = :timeout, cache_ttl = :cache_ttl,
-                            bot_detection_threshold = :bot_detection_threshold, updated_at = :updated_at
-                        WHERE name = :name
-                    """
-                    ),
+                    _UPDATE_CONFIG_SQL,
                     {
                         "name": name,
                         "enabled": config.enabled,
@@ -165,13 +511,13 @@ class DatabaseManager:
                         "timeout": config.timeout,
                         "cache_ttl": config.cache_ttl,
                         "bot_detection_threshold": config.bot_detection_threshold,
-                        "updated_at": datetime.utcnow(),
                     },
                 )
                 await session.commit()
+                self._invalidate_config_cache()
                 return True
-        except Exception as e:
-            print(f"Error updating data source config: {e}")
+        except Exception:
+            logger.exception("Error updating data source config")
             return False
 
     async def delete_data_source_config(self, name: str) -> bool:
@@ -179,112 +525,265 @@ class DatabaseManager:
         try:
             async with self.get_session() as session:
                 await session.execute(
-                    text("DELETE FROM data_source_configs WHERE name = :name"),
+                    _DELETE_CONFIG_SQL,
                     {"name": name},
                 )
                 await session.commit()
+                self._invalidate_config_cache()
                 return True
-        except Exception as e:
-            print(f"Error deleting data source config: {e}")
+        except Exception:
+            logger.exception("Error deleting data source config")
             return False
 
     # Posts and sentiment results storage
-    async def store_analysis_result(self, result: AnalysisResult) -> bool:
-        """Store analysis result in database"""
+    def _post_values(self, post: Post) -> dict:
+        """Get the posts table column values for a Post"""
+        return post.model_dump(include=POST_COLUMNS)
+
+    async def _upsert_post_rows(self, session: AsyncSession, post_rows: List[dict]):
+        """Insert post rows, updating any that already exist"""
+        if not post_rows:
+            return
+
+        if self.engine.dialect.name != "sqlite":
+            for post_row in post_rows:
+                await session.merge(PostTable(**post_row))
+            return
+
+        # One multi-row INSERT ... ON CONFLICT instead of a lookup per post
+        statement = sqlite_insert(PostTable)
+        statement = statement.on_conflict_do_update(
+            index_elements=[PostTable.id],
+            set_={
+                column: statement.excluded[column]
+                for column in POST_COLUMNS
+                if column != "id"
+            },
+        )
+        await session.execute(statement, post_rows)
+
+    def _sentiment_values(self, sentiment_result: SentimentResult) -> dict:
+        """Get the sentiment results table column values for a SentimentResult"""
+        return sentiment_result.model_dump(include=SENTIMENT_COLUMNS)
+
+    async def _insert_sentiment_rows(
+        self, session: AsyncSession, sentiment_rows: List[dict]
+    ):
+        """Insert sentiment result rows with a single executemany"""
+        if sentiment_rows:
+            await session.execute(insert(SentimentResultTable), sentiment_rows)
+
+    async def store_posts(self, posts: List[Post]) -> bool:
+        """Store a batch of posts in a single transaction"""
         try:
             async with self.get_session() as session:
-                # Store posts
-                for post in result.posts:
-                    db_post = PostTable(
-                        id=post.id,
-                        text=post.text,
-                        timestamp=post.timestamp,
-                        author=post.author,
-                        author_id=post.author_id,
-                        location=post.location,
-                        engagement_stats=post.engagement_stats.dict(),
-                        source=post.source,
-                        confidence_score=post.confidence_score,
-                        language=post.language,
-                        hashtags=post.hashtags,
-                        mentions=post.mentions,
-                        urls=post.urls,
-                    )
-                    await session.merge(db_post)  # Use merge to handle duplicates
-
-                # Store sentiment results
-                for sentiment_result in result.sentiment_results:
-                    db_sentiment = SentimentResultTable(
-                        post_id=sentiment_result.post_id,
-                        sentiment=sentiment_result.sentiment.value,
-                        confidence=sentiment_result.confidence,
-                        polarity=sentiment_result.polarity,
-                        subjectivity=sentiment_result.subjectivity,
-                        analyzer_used=sentiment_result.analyzer_used,
-                    )
-                    session.add(db_sentiment)
+                await self._upsert_post_rows(
+                    session, [self._post_values(post) for post in posts]
+                )
+                await session.commit()
+                self._posts_cache.clear()
+                return True
+        except Exception:
+            logger.exception("Error storing posts")
+            return False
 
+    async def store_sentiment_results(self, results: List[SentimentResult]) -> bool:
+        """Store a batch of sentiment results in a single transaction"""
+        try:
+            async with self.get_session() as session:
+                await self._insert_sentiment_rows(
+                    session, [self._sentiment_values(result) for result in results]
+                )
                 await session.commit()
                 return True
-        except Exception as e:
-            print(f"Error storing analysis result: {e}")
+        except Exception:
+            logger.exception("Error storing sentiment results")
             return False
 
-    async def get_posts_by_query(self, query: str, limit: int = 100) -> List[Post]:
-        """Get posts by search query"""
+    def prepare_analysis_result(self, result: AnalysisResult) -> PendingAnalysisWrite:
+        """
+        Convert an analysis result into table rows without touching the database
+
+        This is the CPU-bound half of store_analysis_result. Callers processing
+        several results can prepare the next one while the previous
+        commit_pending call is still awaiting the database.
+        """
+        # One model_dump walks every post and sentiment result in pydantic-core
+        rows = result.model_dump(include=ANALYSIS_ROW_FIELDS)
+        return PendingAnalysisWrite(
+            post_rows=rows["posts"], sentiment_rows=rows["sentiment_results"]
+        )
+
+    async def commit_pending(
+        self, pending: PendingAnalysisWrite, session: Optional[AsyncSession] = None
+    ) -> bool:
+        """
+        Write prepared analysis rows in a single transaction
+
+        Overlapping commits are safe but do not run in parallel: SQLite
+        allows one writer at a time, so concurrent commits queue on the
+        database lock (bounded by the busy timeout). With a session from
+        begin_transaction or bulk_ingest the rows are written in the
+        caller's transaction and errors propagate.
+        """
+        if session is not None:
+            await self._upsert_post_rows(session, pending.post_rows)
+            await self._insert_sentiment_rows(session, pending.sentiment_rows)
+            return True
+
         try:
             async with self.get_session() as session:
-                result = await session.execute(
-                    text(
-                        """
-                        SELECT * FROM posts 
-                        WHERE text LIKE :query 
-                        ORDER BY timestamp DESC 
-                        LIMIT :limit
-                    """
-                    ),
-                    {"query": f"%{query}%", "limit": limit},
+                await self._upsert_post_rows(session, pending.post_rows)
+                await self._insert_sentiment_rows(session, pending.sentiment_rows)
+                await session.commit()
+                if pending.post_rows:
+                    self._posts_cache.clear()
+                return True
+        except Exception:
+            logger.exception("Error storing analysis result")
+            return False
+
+    async def store_analysis_result(
+        self, result: AnalysisResult, session: Optional[AsyncSession] = None
+    ) -> bool:
+        """Store analysis result in database"""
+        return await self.commit_pending(
+            self.prepare_analysis_result(result), session=session
+        )
+
+    def _posts_matching(self, query: str) -> Select:
+        """Build a select of posts whose text contains the query"""
+        statement = select(*POST_SELECT_COLUMNS)
+        if self._fts_enabled and len(query) >= FTS_MIN_QUERY_LENGTH:
+            # Quote the query as a single FTS5 string so it matches literally
+            fts_query = '"' + query.replace('"', '""') + '"'
+            return statement.where(
+                literal_column("posts.rowid").in_(
+                    select(literal_column("rowid"))
+                    .select_from(_POSTS_FTS)
+                    .where(literal_column("posts_fts").op("MATCH")(fts_query))
                 )
-                rows = result.fetchall()
-
-                posts = []
-                import json
-
-                for row in rows:
-                    post = Post(
-                        id=row.id,
-                        text=row.text,
-                        timestamp=row.timestamp,
-                        author=row.author,
-                        author_id=row.author_id,
-                        location=row.location,
-                        engagement_stats=(
-                            json.loads(row.engagement_stats)
-                            if isinstance(row.engagement_stats, str)
-                            else row.engagement_stats
-                        ),
-                        source=row.source,
-                        confidence_score=row.confidence_score,
-                        language=row.language,
-                        hashtags=(
-                            json.loads(row.hashtags)
-                            if isinstance(row.hashtags, str)
-                            else row.hashtags
-                        ),
-                        mentions=(
-                            json.loads(row.mentions)
-                            if isinstance(row.mentions, str)
-                            else row.mentions
-                        ),
-                        urls=(
-                            json.loads(row.urls)
-                            if isinstance(row.urls, str)
-                            else row.urls
-                        ),
-                    )
-                    posts.append(post)
+            )
+        return statement.where(PostTable.text.like(f"%{query}%"))
+
+    async def stream_posts_by_query(
+        self, query: str, limit: int = 100, batch_size: int = 200
+    ) -> AsyncIterator[Post]:
+        """
+        Stream posts matching a search query, newest first
 
-                return posts
-        except Exception as e:
-            print(f"Error getting posts by query: {e}")
+        Rows are fetched from the cursor in batches of batch_size, so only
+        one batch is held in memory at a time.
+        """
+        try:
+            async for post in self._iter_posts_by_query(query, limit, batch_size):
+                yield post
+        except Exception:
+            logger.exception("Error streaming posts by query")
+
+    async def _iter_posts_by_query(
+        self, query: str, limit: int, batch_size: int = 200
+    ) -> AsyncIterator[Post]:
+        """Stream posts matching a search query, letting database errors propagate"""
+        statement = self._posts_matching(query)
+        async with self.get_session() as session:
+            result = await session.stream(
+                statement.order_by(PostTable.timestamp.desc())
+                .limit(limit)
+                .execution_options(yield_per=batch_size)
+            )
+            async for row in result.mappings():
+                yield _post_from_row(row)
+
+    async def get_posts_by_query(self, query: str, limit: int = 100) -> List[Post]:
+        """
+        Get posts by search query
+
+        Results are reused for POSTS_CACHE_TTL seconds; any post write
+        clears the cache. A failed read returns an empty list and is not
+        cached.
+        """
+        key = (query, limit)
+        entry = self._posts_cache.get(key)
+        if entry is not None:
+            cached_at, cached_posts = entry
+            if time.monotonic() - cached_at < POSTS_CACHE_TTL:
+                # Deep copies, since posts hold lists and nested models
+                return [post.model_copy(deep=True) for post in cached_posts]
+            del self._posts_cache[key]
+
+        try:
+            posts = [post async for post in self._iter_posts_by_query(query, limit)]
+        except Exception:
+            logger.exception("Error getting posts by query")
             return []
+
+        if len(self._posts_cache) >= POSTS_CACHE_SIZE:
+            # Evict the oldest entry; dicts keep insertion order
+            del self._posts_cache[next(iter(self._posts_cache))]
+        self._posts_cache[key] = (time.monotonic(), posts)
+        return [post.model_copy(deep=True) for post in posts]
+
+    async def paginate_query(
+        self, session: AsyncSession, statement: Select, offset: int, limit: int
+    ) -> Tuple[List, int]:
+        """
+        Fetch one page of a select along with the total number of rows
+
+        Args:
+            session: Session to run both queries on
+            statement: Ordered select to paginate
+            offset: Number of rows to skip
+            limit: Maximum number of rows to return
+
+        Returns:
+            Tuple of the page's rows and the total row count
+        """
+        # A session runs one statement at a time, so the count and page
+        # queries are issued back to back rather than gathered
+        total = await session.scalar(
+            select(func.count()).select_from(statement.order_by(None).subquery())
+        )
+        result = await session.execute(statement.limit(limit).offset(offset))
+        return result.all(), total
+
+    async def get_posts_page_by_query(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 50,
+        before: Optional[datetime] = None,
+        before_id: Optional[str] = None,
+    ) -> PaginatedResponse[Post]:
+        """
+        Get one page of posts matching a search query, newest first
+
+        Passing the timestamp and id of the last post seen as before and
+        before_id pages by key instead of by offset, so deep pages do not
+        scan the skipped rows. Posts sharing a timestamp are ordered by id,
+        so none are skipped at a page boundary. With a key, offset is
+        ignored and total, page and has_previous describe only the posts
+        after the key, not the whole result set.
+        """
+        statement = self._posts_matching(query)
+        if before is not None:
+            if before_id is None:
+                cursor = PostTable.timestamp < before
+            else:
+                cursor = or_(
+                    PostTable.timestamp < before,
+                    and_(PostTable.timestamp == before, PostTable.id < before_id),
+                )
+            statement = statement.where(cursor)
+            offset = 0
+        statement = statement.order_by(PostTable.timestamp.desc(), PostTable.id.desc())
+        try:
+            async with self.get_session() as session:
+                rows, total = await self.paginate_query(
+                    session, statement, offset, limit
+                )
+                posts = [_post_from_row(row._mapping) for row in rows]
+                return create_paginated_response(posts, offset, limit, total)
+        except Exception:
+            logger.exception("Error getting posts page by query")
+            return create_paginated_response([], offset, limit, 0)
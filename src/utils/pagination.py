@@ -1,4 +1,6 @@
-from typing import Generic, List, TypeVar
+import functools
+from itertools import islice
+from typing import Generic, Iterable, Iterator, List, Sequence, Tuple, TypeVar
 
 from pydantic import BaseModel
 
@@ -15,28 +17,67 @@ class PaginatedResponse(BaseModel, Generic[T]):
     has_previous: bool
 
 
-def paginate_results(items: List[T], offset: int = 0, limit: int = 50) -> List[T]:
+def _normalize_page(offset: int, limit: int):
+    """Clamp a negative offset to zero and replace a non-positive limit"""
+    if offset < 0:
+        offset = 0
+
+    if limit <= 0:
+        limit = 50
+
+    return offset, limit
+
+
+def paginate_iter(items: Iterable[T], offset: int = 0, limit: int = 50) -> Iterator[T]:
+    """
+    Lazily paginate an iterable of items
+
+    Args:
+        items: Iterable of items to paginate, e.g. a streaming query
+        offset: Starting index
+        limit: Number of items per page
+
+    Returns:
+        Iterator over the items of the page, consumed without copying
+    """
+    offset, limit = _normalize_page(offset, limit)
+
+    return islice(items, offset, offset + limit)
+
+
+def paginate_results(items: Iterable[T], offset: int = 0, limit: int = 50) -> List[T]:
     """
     Paginate a list of items
 
     Args:
-        items: List of items to paginate
+        items: List (or any iterable) of items to paginate
         offset: Starting index
         limit: Number of items per page
 
     Returns:
         Paginated list of items
     """
-    if offset < 0:
-        offset = 0
+    if not isinstance(items, Sequence):
+        return list(paginate_iter(items, offset, limit))
 
-    if limit <= 0:
-        limit = 50
+    offset, limit = _normalize_page(offset, limit)
 
-    start_index = offset
-    end_index = offset + limit
+    return items[offset : offset + limit]
 
-    return items[start_index:end_index]
+
+@functools.lru_cache(maxsize=1024)
+def _page_meta(
+    offset: int, limit: int, total_items: int
+) -> Tuple[int, int, bool, bool]:
+    """Compute page, total_pages, has_next and has_previous for a page shape"""
+    # Special handling for zero limit
+    if limit == 0:
+        return 1, 1, False, False
+
+    page = (offset // limit) + 1 if limit > 0 else 1
+    total_pages = (total_items + limit - 1) // limit if limit > 0 else 1
+
+    return page, total_pages, offset + limit < total_items, offset > 0
 
 
 def create_paginated_response(
@@ -54,16 +95,7 @@ def create_paginated_response(
     Returns:
         PaginatedResponse object
     """
-    page = (offset // limit) + 1 if limit > 0 else 1
-    total_pages = (total_items + limit - 1) // limit if limit > 0 else 1
-
-    # Special handling for zero limit
-    if limit == 0:
-        has_next = False
-        has_previous = False
-    else:
-        has_next = offset + limit < total_items
-        has_previous = offset > 0
+    page, total_pages, has_next, has_previous = _page_meta(offset, limit, total_items)
 
     return PaginatedResponse(
         items=items,
@@ -1,16 +1,5 @@
 import pytest
 
-# Import all test modules to make them discoverable
-from . import (
-    test_api,
-    test_cache,
-    test_database,
-    test_datasources,
-    test_integration,
-    test_sentiment,
-    test_utils,
-)
-
 # Configuration for pytest
 pytest_plugins = []
 
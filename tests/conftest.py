@@ -0,0 +1,66 @@
+import anyio
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _serve_with_portal(test_client):
+    """Yield a TestClient that reuses one event loop thread for every request"""
+    # Without a portal TestClient starts a new event loop thread per request;
+    # entering the client would provide one but also run app startup
+    with anyio.from_thread.start_blocking_portal(**test_client.async_backend) as portal:
+        test_client.portal = portal
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, imported only when an HTTP test needs it"""
+    # Skip the HTTP tests, not the whole module, if the app fails to import
+    main = pytest.importorskip("src.main")
+    return main.app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """One TestClient shared by every HTTP test in the session"""
+    # Not entered as a context manager: startup would initialize the on-disk
+    # database and shutdown would dispose the shared engine
+    yield from _serve_with_portal(TestClient(app))
+
+
+@pytest.fixture(scope="session")
+def lean_app():
+    """App without CORS and security header middleware, for route-only tests"""
+    main = pytest.importorskip("src.main")
+    return main.create_app(enable_middleware=False)
+
+
+@pytest.fixture(scope="session")
+def lean_client(lean_app):
+    """TestClient for the middleware-free app, shared across the session"""
+    yield from _serve_with_portal(TestClient(lean_app))
+
+
+def _get_json(client, path):
+    """Fetch a read-only endpoint once and return its parsed body"""
+    response = client.get(path)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def summary_data(lean_client):
+    """Parsed /api/v1/dashboard/summary body shared by read-only tests"""
+    return _get_json(lean_client, "/api/v1/dashboard/summary")
+
+
+@pytest.fixture(scope="session")
+def analytics_data(lean_client):
+    """Parsed /api/v1/dashboard/analytics body shared by read-only tests"""
+    return _get_json(lean_client, "/api/v1/dashboard/analytics")
+
+
+@pytest.fixture(scope="session")
+def heatmap_data(lean_client):
+    """Parsed default /api/v1/dashboard/heat-map body shared by read-only tests"""
+    return _get_json(lean_client, "/api/v1/dashboard/heat-map")
@@ -11,38 +11,55 @@ from src.models.schemas import (
     SentimentType,
 )
 
+# Fixed timestamp so the shared result is identical across runs
+_FIXED_DT = datetime(2024, 1, 1)
+
+_DIST = {
+    SentimentType.POSITIVE: 1,
+    SentimentType.NEGATIVE: 0,
+    SentimentType.NEUTRAL: 0,
+}
+
+
+# Queries shared by the cache tests; built once without validation
+Q = SearchQuery.model_construct(query="test", limit=10)
+Q1 = SearchQuery.model_construct(query="test1", limit=10)
+Q2 = SearchQuery.model_construct(query="test2", limit=10)
+
+
+@pytest.fixture(scope="module")
+def sample_result():
+    """Analysis result shared by the cache tests; built without validation"""
+    return AnalysisResult.model_construct(
+        query="test",
+        total_posts=1,
+        sentiment_distribution=_DIST,
+        average_confidence=0.8,
+        sources_used=["test"],
+        posts=[],
+        sentiment_results=[],
+        created_at=_FIXED_DT,
+        processing_time=0.5,
+    )
+
 
 class TestCacheManager:
     """Test cache manager"""
 
     def setup_method(self):
-        self.cache_manager = CacheManager(default_ttl=3600)
-
-    def test_cache_set_and_get(self):
-        """Test setting and getting cache entries"""
-        query = SearchQuery(query="test", limit=10)
-
-        result = AnalysisResult(
-            query="test",
-            total_posts=1,
-            sentiment_distribution={
-                SentimentType.POSITIVE: 1,
-                SentimentType.NEGATIVE: 0,
-                SentimentType.NEUTRAL: 0,
-            },
-            average_confidence=0.8,
-            sources_used=["test"],
-            posts=[],
-            sentiment_results=[],
-            created_at=datetime.now(),
-            processing_time=0.5,
+        # Controllable clock so expiry tests do not have to sleep
+        self.clock = [1000.0]
+        self.cache_manager = CacheManager(
+            default_ttl=3600, time_fn=lambda: self.clock[0]
         )
 
+    def test_cache_set_and_get(self, sample_result):
+        """Test setting and getting cache entries"""
         # Set cache
-        self.cache_manager.set(query, result)
+        self.cache_manager.set(Q, sample_result)
 
         # Get cache
-        cached_result = self.cache_manager.get(query)
+        cached_result = self.cache_manager.get(Q)
         assert cached_result is not None
         assert cached_result.query == "test"
         assert cached_result.total_posts == 1
@@ -65,104 +82,46 @@ class TestCacheManager:
 
     def test_cache_key_different_queries(self):
         """Test different queries generate different keys"""
-        query1 = SearchQuery(query="test1", limit=10)
-        query2 = SearchQuery(query="test2", limit=10)
-
-        key1 = self.cache_manager._generate_key(query1)
-        key2 = self.cache_manager._generate_key(query2)
+        key1 = self.cache_manager._generate_key(Q1)
+        key2 = self.cache_manager._generate_key(Q2)
 
         assert key1 != key2
 
-    def test_cache_invalidation(self):
+    def test_cache_invalidation(self, sample_result):
         """Test cache invalidation"""
-        query = SearchQuery(query="test", limit=10)
-
-        result = AnalysisResult(
-            query="test",
-            total_posts=1,
-            sentiment_distribution={
-                SentimentType.POSITIVE: 1,
-                SentimentType.NEGATIVE: 0,
-                SentimentType.NEUTRAL: 0,
-            },
-            average_confidence=0.8,
-            sources_used=["test"],
-            posts=[],
-            sentiment_results=[],
-            created_at=datetime.now(),
-            processing_time=0.5,
-        )
-
         # Set cache
-        self.cache_manager.set(query, result)
+        self.cache_manager.set(Q, sample_result)
 
         # Verify cached
-        cached_result = self.cache_manager.get(query)
+        cached_result = self.cache_manager.get(Q)
         assert cached_result is not None
 
         # Invalidate
-        success = self.cache_manager.invalidate(query)
+        success = self.cache_manager.invalidate(Q)
         assert success
 
         # Verify not cached
-        cached_result = self.cache_manager.get(query)
+        cached_result = self.cache_manager.get(Q)
         assert cached_result is None
 
-    def test_cache_clear_all(self):
+    def test_cache_clear_all(self, sample_result):
         """Test clearing all cache entries"""
-        query1 = SearchQuery(query="test1", limit=10)
-        query2 = SearchQuery(query="test2", limit=10)
-
-        result = AnalysisResult(
-            query="test",
-            total_posts=1,
-            sentiment_distribution={
-                SentimentType.POSITIVE: 1,
-                SentimentType.NEGATIVE: 0,
-                SentimentType.NEUTRAL: 0,
-            },
-            average_confidence=0.8,
-            sources_used=["test"],
-            posts=[],
-            sentiment_results=[],
-            created_at=datetime.now(),
-            processing_time=0.5,
-        )
-
         # Set multiple cache entries
-        self.cache_manager.set(query1, result)
-        self.cache_manager.set(query2, result)
+        self.cache_manager.set(Q1, sample_result)
+        self.cache_manager.set(Q2, sample_result)
 
         # Clear all
         cleared = self.cache_manager.clear_all()
         assert cleared == 2
 
         # Verify all cleared
-        assert self.cache_manager.get(query1) is None
-        assert self.cache_manager.get(query2) is None
+        assert self.cache_manager.get(Q1) is None
+        assert self.cache_manager.get(Q2) is None
 
-    def test_cache_stats(self):
+    def test_cache_stats(self, sample_result):
         """Test cache statistics"""
-        query = SearchQuery(query="test", limit=10)
-
-        result = AnalysisResult(
-            query="test",
-            total_posts=1,
-            sentiment_distribution={
-                SentimentType.POSITIVE: 1,
-                SentimentType.NEGATIVE: 0,
-                SentimentType.NEUTRAL: 0,
-            },
-            average_confidence=0.8,
-            sources_used=["test"],
-            posts=[],
-            sentiment_results=[],
-            created_at=datetime.now(),
-            processing_time=0.5,
-        )
-
         # Set cache
-        self.cache_manager.set(query, result)
+        self.cache_manager.set(Q, sample_result)
 
         # Get stats
         stats = self.cache_manager.get_stats()
@@ -172,114 +131,55 @@ class TestCacheManager:
         assert stats["total_hits"] == 0
 
         # Access cache to increment hit count
-        self.cache_manager.get(query)
+        self.cache_manager.get(Q)
 
         stats = self.cache_manager.get_stats()
         assert stats["total_hits"] == 1
 
-    def test_cache_hit_count(self):
+    def test_cache_hit_count(self, sample_result):
         """Test cache hit count tracking"""
-        query = SearchQuery(query="test", limit=10)
-
-        result = AnalysisResult(
-            query="test",
-            total_posts=1,
-            sentiment_distribution={
-                SentimentType.POSITIVE: 1,
-                SentimentType.NEGATIVE: 0,
-                SentimentType.NEUTRAL: 0,
-            },
-            average_confidence=0.8,
-            sources_used=["test"],
-            posts=[],
-            sentiment_results=[],
-            created_at=datetime.now(),
-            processing_time=0.5,
-        )
-
         # Set cache
-        self.cache_manager.set(query, result)
+        self.cache_manager.set(Q, sample_result)
 
         # Access multiple times
         for i in range(5):
-            self.cache_manager.get(query)
+            self.cache_manager.get(Q)
 
         stats = self.cache_manager.get_stats()
         assert stats["total_hits"] == 5
 
-    def test_cache_expiry(self):
+    def test_cache_expiry(self, sample_result):
         """Test cache expiry (simulated)"""
-        query = SearchQuery(query="test", limit=10)
-
-        result = AnalysisResult(
-            query="test",
-            total_posts=1,
-            sentiment_distribution={
-                SentimentType.POSITIVE: 1,
-                SentimentType.NEGATIVE: 0,
-                SentimentType.NEUTRAL: 0,
-            },
-            average_confidence=0.8,
-            sources_used=["test"],
-            posts=[],
-            sentiment_results=[],
-            created_at=datetime.now(),
-            processing_time=0.5,
-        )
-
         # Set cache with very short TTL
-        self.cache_manager.set(query, result, ttl=0.1)
+        self.cache_manager.set(Q, sample_result, ttl=0.1)
 
         # Should be available immediately
-        cached_result = self.cache_manager.get(query)
+        cached_result = self.cache_manager.get(Q)
         assert cached_result is not None
 
-        # Wait for expiry (simulate by directly manipulating expires_at)
-        import time
-
-        time.sleep(0.2)
+        # Advance the clock past the TTL
+        self.clock[0] += 0.2
 
         # Should be expired and removed
-        cached_result = self.cache_manager.get(query)
+        cached_result = self.cache_manager.get(Q)
         assert cached_result is None
 
-    def test_clear_expired_entries(self):
+    def test_clear_expired_entries(self, sample_result):
         """Test clearing expired entries"""
-        query1 = SearchQuery(query="test1", limit=10)
-        query2 = SearchQuery(query="test2", limit=10)
-
-        result = AnalysisResult(
-            query="test",
-            total_posts=1,
-            sentiment_distribution={
-                SentimentType.POSITIVE: 1,
-                SentimentType.NEGATIVE: 0,
-                SentimentType.NEUTRAL: 0,
-            },
-            average_confidence=0.8,
-            sources_used=["test"],
-            posts=[],
-            sentiment_results=[],
-            created_at=datetime.now(),
-            processing_time=0.5,
-        )
-
         # Set one with short TTL, one with long TTL
-        self.cache_manager.set(query1, result, ttl=0.1)
-        self.cache_manager.set(query2, result, ttl=3600)
-
-        # Wait for first to expire
-        import time
+        self.cache_manager.set(Q1, sample_result, ttl=0.1)
+        self.cache_manager.set(Q2, sample_result, ttl=3600)
 
-        time.sleep(0.2)
+        # Advance the clock until the first expires
+        self.clock[0] += 0.2
 
         # Clear expired
         cleared = self.cache_manager.clear_expired()
         assert cleared == 1
 
         # Verify correct one was cleared
-        assert self.cache_manager.get(query1) is None
-        assert self.cache_manager.get(query2) is not None
+        assert self.cache_manager.get(Q1) is None
+        assert self.cache_manager.get(Q2) is not None
 
 
 if __name__ == "__main__":
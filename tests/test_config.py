@@ -2,9 +2,7 @@
 Tests for the configuration management system
 """
 
-import os
 import pytest
-from unittest.mock import patch
 
 from src.config.app_config import AppConfig, get_app_config, reload_config
 from src.config.security_config import SecurityConfig, get_security_config, reload_security_config
@@ -26,7 +24,7 @@ class TestAppConfig:
         assert config.enable_analytics is True
         assert config.enable_caching is True
     
-    def test_from_env(self):
+    def test_from_env(self, monkeypatch):
         """Test configuration from environment variables"""
         env_vars = {
             'DEBUG': 'true',
@@ -38,16 +36,18 @@ class TestAppConfig:
             'LOG_LEVEL': 'DEBUG'
         }
         
-        with patch.dict(os.environ, env_vars):
-            config = AppConfig.from_env()
-            
-            assert config.debug is True
-            assert config.host == '127.0.0.1'
-            assert config.port == 9000
-            assert config.cors_origins == ['http://localhost:3000', 'https://example.com']
-            assert config.database.url == 'postgresql://test'
-            assert config.cache.ttl == 7200
-            assert config.logging.level == 'DEBUG'
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
+        
+        config = AppConfig.from_env()
+        
+        assert config.debug is True
+        assert config.host == '127.0.0.1'
+        assert config.port == 9000
+        assert config.cors_origins == ['http://localhost:3000', 'https://example.com']
+        assert config.database.url == 'postgresql://test'
+        assert config.cache.ttl == 7200
+        assert config.logging.level == 'DEBUG'
     
     def test_cors_origins_parsing(self):
         """Test CORS origins parsing from string"""
@@ -80,6 +80,12 @@ class TestAppConfig:
         assert config.logging.backup_count >= 1
 
 
+@pytest.fixture(scope="module")
+def security_config():
+    """Default SecurityConfig shared by read-only tests"""
+    return SecurityConfig()
+
+
 class TestSecurityConfig:
     """Test the SecurityConfig class"""
     
@@ -95,7 +101,7 @@ class TestSecurityConfig:
         assert config.min_password_length == 8
         assert config.enable_csp is True
     
-    def test_from_env(self):
+    def test_from_env(self, monkeypatch):
         """Test security configuration from environment"""
         env_vars = {
             'SECURITY_ENABLE_AUTHENTICATION': 'true',
@@ -105,14 +111,16 @@ class TestSecurityConfig:
             'SECURITY_SECRET_KEY': 'test-secret-key'
         }
         
-        with patch.dict(os.environ, env_vars):
-            config = SecurityConfig.from_env()
-            
-            assert config.enable_authentication is True
-            assert config.require_api_keys is True
-            assert config.force_https is True
-            assert config.jwt_secret_key == 'test-jwt-key'
-            assert config.secret_key == 'test-secret-key'
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
+        
+        config = SecurityConfig.from_env()
+        
+        assert config.enable_authentication is True
+        assert config.require_api_keys is True
+        assert config.force_https is True
+        assert config.jwt_secret_key == 'test-jwt-key'
+        assert config.secret_key == 'test-secret-key'
     
     def test_jwt_algorithm_validation(self):
         """Test JWT algorithm validation"""
@@ -124,34 +132,22 @@ class TestSecurityConfig:
         with pytest.raises(ValueError, match="JWT algorithm must be one of"):
             SecurityConfig(jwt_algorithm="INVALID")
     
-    def test_password_validation(self):
+    @pytest.mark.parametrize("password,is_valid,expected_error", [
+        ("StrongP@ss1", True, None),
+        ("weak", False, "at least 8 characters"),
+        ("weakpass1!", False, "uppercase letter"),
+        ("WeakPass!", False, "number"),
+        ("WeakPass1", False, "special character"),
+    ])
+    def test_password_validation(self, security_config, password, is_valid, expected_error):
         """Test password validation"""
-        config = SecurityConfig()
-        
-        # Valid password
-        valid, errors = config.validate_password("StrongP@ss1")
-        assert valid is True
-        assert len(errors) == 0
-        
-        # Invalid password - too short
-        valid, errors = config.validate_password("weak")
-        assert valid is False
-        assert any("at least 8 characters" in error for error in errors)
-        
-        # Invalid password - missing uppercase
-        valid, errors = config.validate_password("weakpass1!")
-        assert valid is False
-        assert any("uppercase letter" in error for error in errors)
+        valid, errors = security_config.validate_password(password)
         
-        # Invalid password - missing number
-        valid, errors = config.validate_password("WeakPass!")
-        assert valid is False
-        assert any("number" in error for error in errors)
-        
-        # Invalid password - missing special character
-        valid, errors = config.validate_password("WeakPass1")
-        assert valid is False
-        assert any("special character" in error for error in errors)
+        assert valid is is_valid
+        if expected_error is None:
+            assert len(errors) == 0
+        else:
+            assert any(expected_error in error for error in errors)
     
     def test_csp_header_generation(self):
         """Test CSP header generation"""
@@ -209,6 +205,12 @@ class TestSecurityConfig:
 class TestConfigurationGlobals:
     """Test global configuration functions"""
     
+    @pytest.fixture(autouse=True)
+    def _reset_config_singletons(self, monkeypatch):
+        """Start each test without cached configs and restore them afterwards"""
+        monkeypatch.setattr("src.config.app_config._app_config", None)
+        monkeypatch.setattr("src.config.security_config._security_config", None)
+    
     def test_get_app_config_singleton(self):
         """Test that get_app_config returns singleton instance"""
         config1 = get_app_config()
@@ -17,6 +17,12 @@ class MockAnotherService:
     pass
 
 
+class NonInstantiableService:
+    """Test service the container cannot build without arguments"""
+    def __init__(self, required_param):
+        self.required_param = required_param
+
+
 class TestContainer:
     """Test the dependency injection container"""
     
@@ -75,10 +81,6 @@ class TestContainer:
     
     def test_get_nonexistent_service(self):
         """Test getting a service that cannot be resolved"""
-        class NonInstantiableService:
-            def __init__(self, required_param):
-                self.required_param = required_param
-        
         with pytest.raises(ValueError, match="Cannot resolve service"):
             self.container.get(NonInstantiableService)
     
@@ -93,10 +95,6 @@ class TestContainer:
     
     def test_get_or_none_failure(self):
         """Test get_or_none with non-resolvable service"""
-        class NonInstantiableService:
-            def __init__(self, required_param):
-                self.required_param = required_param
-        
         result = self.container.get_or_none(NonInstantiableService)
         
         assert result is None
@@ -117,4 +115,7 @@ class TestContainer:
         key = self.container._get_key(MockService)
         
         expected_key = f"{MockService.__module__}.{MockService.__name__}"
-        assert key == expected_key
\ No newline at end of file
+        assert key == expected_key
+        
+        # Repeated lookups reuse the cached key
+        assert self.container._get_key(MockService) is key
\ No newline at end of file
@@ -1,52 +1,79 @@
 import pytest
-from fastapi.testclient import TestClient
-from src.main import app
 
-client = TestClient(app)
-
-
-def test_dashboard_summary():
-    """Test dashboard summary endpoint"""
-    response = client.get("/api/v1/dashboard/summary")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert "total_posts_with_location" in data
-    assert "total_unique_locations" in data
-    assert "overall_sentiment_distribution" in data
-    assert "top_regions" in data
-    assert "last_updated" in data
-    
-    # Check sentiment distribution structure
-    sentiment_dist = data["overall_sentiment_distribution"]
-    assert "positive" in sentiment_dist
-    assert "negative" in sentiment_dist
-    assert "neutral" in sentiment_dist
-
-
-def test_dashboard_geographic_sentiment():
+SENTIMENT_KEYS = frozenset({"positive", "negative", "neutral"})
+SUMMARY_KEYS = frozenset(
+    {
+        "total_posts_with_location",
+        "total_unique_locations",
+        "overall_sentiment_distribution",
+        "top_regions",
+        "last_updated",
+    }
+)
+ENHANCED_SUMMARY_KEYS = frozenset(
+    {"total_posts", "trending_topics", "recent_activity", "performance_metrics"}
+)
+GEOGRAPHIC_KEYS = frozenset(
+    {"geographic_data", "total_regions", "query_filters", "generated_at"}
+)
+LOCATION_KEYS = frozenset(
+    {"location", "total_posts", "sentiment_distribution", "average_confidence"}
+)
+TRENDS_KEYS = frozenset(
+    {"trends_data", "timeframe", "start_date", "end_date", "total_regions"}
+)
+TREND_KEYS = frozenset({"location", "total_posts", "daily_data"})
+HEAT_MAP_KEYS = frozenset(
+    {"heat_map_data", "timeframe", "resolution", "start_date", "end_date", "total_topics"}
+)
+HEAT_MAP_TOPIC_KEYS = frozenset({"topic", "time_series"})
+HEAT_MAP_POINT_KEYS = SENTIMENT_KEYS | {"timestamp", "sentiment_score"}
+TRENDING_TOPIC_KEYS = frozenset({"topic", "mentions", "sentiment_score"})
+ACTIVITY_KEYS = frozenset({"timestamp", "event"})
+PERFORMANCE_KEYS = frozenset(
+    {"avg_processing_time", "api_response_time", "cache_hit_rate", "uptime_percentage"}
+)
+
+
+@pytest.mark.parametrize(
+    "section, required",
+    [
+        (None, SUMMARY_KEYS | ENHANCED_SUMMARY_KEYS),
+        ("overall_sentiment_distribution", SENTIMENT_KEYS),
+        ("trending_topics", TRENDING_TOPIC_KEYS),
+        ("recent_activity", ACTIVITY_KEYS),
+        ("performance_metrics", PERFORMANCE_KEYS),
+    ],
+    ids=["top_level", "sentiment", "trending_topics", "recent_activity", "performance"],
+)
+def test_dashboard_summary(summary_data, section, required):
+    """Test each dashboard summary section has its required keys"""
+    data = summary_data if section is None else summary_data[section]
+    # List sections are checked item by item
+    for item in data if isinstance(data, list) else [data]:
+        missing = required - item.keys()
+        assert not missing, missing
+
+
+def test_dashboard_geographic_sentiment(lean_client):
     """Test geographic sentiment endpoint"""
-    response = client.get("/api/v1/dashboard/geographic-sentiment")
+    response = lean_client.get("/api/v1/dashboard/geographic-sentiment")
     assert response.status_code == 200
     
     data = response.json()
-    assert "geographic_data" in data
-    assert "total_regions" in data
-    assert "query_filters" in data
-    assert "generated_at" in data
+    missing = GEOGRAPHIC_KEYS - data.keys()
+    assert not missing, missing
     
     # Check geographic data structure
     if data["geographic_data"]:
         first_location = data["geographic_data"][0]
-        assert "location" in first_location
-        assert "total_posts" in first_location
-        assert "sentiment_distribution" in first_location
-        assert "average_confidence" in first_location
+        missing = LOCATION_KEYS - first_location.keys()
+        assert not missing, missing
 
 
-def test_dashboard_geographic_sentiment_with_params():
+def test_dashboard_geographic_sentiment_with_params(lean_client):
     """Test geographic sentiment endpoint with query parameters"""
-    response = client.get("/api/v1/dashboard/geographic-sentiment?limit=3&query=test")
+    response = lean_client.get("/api/v1/dashboard/geographic-sentiment?limit=3&query=test")
     assert response.status_code == 200
     
     data = response.json()
@@ -55,76 +82,60 @@ def test_dashboard_geographic_sentiment_with_params():
     assert data["query_filters"]["query"] == "test"
 
 
-def test_dashboard_interest_trends():
+def test_dashboard_interest_trends(lean_client):
     """Test interest trends endpoint"""
-    response = client.get("/api/v1/dashboard/interest-trends")
+    response = lean_client.get("/api/v1/dashboard/interest-trends")
     assert response.status_code == 200
     
     data = response.json()
-    assert "trends_data" in data
-    assert "timeframe" in data
-    assert "start_date" in data
-    assert "end_date" in data
-    assert "total_regions" in data
+    missing = TRENDS_KEYS - data.keys()
+    assert not missing, missing
     
     # Check trends data structure
     if data["trends_data"]:
         first_trend = data["trends_data"][0]
-        assert "location" in first_trend
-        assert "total_posts" in first_trend
-        assert "daily_data" in first_trend
+        missing = TREND_KEYS - first_trend.keys()
+        assert not missing, missing
 
 
-def test_dashboard_interest_trends_timeframes():
+@pytest.mark.parametrize("timeframe", ["1d", "7d", "30d"])
+def test_dashboard_interest_trends_timeframes(lean_client, timeframe):
     """Test interest trends with different timeframes"""
-    timeframes = ["1d", "7d", "30d"]
+    response = lean_client.get(f"/api/v1/dashboard/interest-trends?timeframe={timeframe}")
+    assert response.status_code == 200
     
-    for timeframe in timeframes:
-        response = client.get(f"/api/v1/dashboard/interest-trends?timeframe={timeframe}")
-        assert response.status_code == 200
-        
-        data = response.json()
-        assert data["timeframe"] == timeframe
+    data = response.json()
+    assert data["timeframe"] == timeframe
 
 
-def test_dashboard_endpoints_cors():
+def test_dashboard_endpoints_cors(client):
     """Test CORS headers are present on dashboard endpoints"""
     response = client.options("/api/v1/dashboard/summary")
     # The OPTIONS request should be handled by CORS middleware
     assert response.status_code in [200, 405]  # 405 if OPTIONS not explicitly handled
 
 
-def test_dashboard_heat_map():
+def test_dashboard_heat_map(heatmap_data):
     """Test heat map endpoint"""
-    response = client.get("/api/v1/dashboard/heat-map")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert "heat_map_data" in data
-    assert "timeframe" in data
-    assert "resolution" in data
-    assert "start_date" in data
-    assert "end_date" in data
-    assert "total_topics" in data
+    data = heatmap_data
+    missing = HEAT_MAP_KEYS - data.keys()
+    assert not missing, missing
     
     # Check heat map data structure
     if data["heat_map_data"]:
         first_topic = data["heat_map_data"][0]
-        assert "topic" in first_topic
-        assert "time_series" in first_topic
+        missing = HEAT_MAP_TOPIC_KEYS - first_topic.keys()
+        assert not missing, missing
         
         if first_topic["time_series"]:
             first_point = first_topic["time_series"][0]
-            assert "timestamp" in first_point
-            assert "positive" in first_point
-            assert "negative" in first_point
-            assert "neutral" in first_point
-            assert "sentiment_score" in first_point
+            missing = HEAT_MAP_POINT_KEYS - first_point.keys()
+            assert not missing, missing
 
 
-def test_dashboard_heat_map_with_params():
+def test_dashboard_heat_map_with_params(lean_client):
     """Test heat map endpoint with parameters"""
-    response = client.get("/api/v1/dashboard/heat-map?topic=test&timeframe=1d&resolution=hourly")
+    response = lean_client.get("/api/v1/dashboard/heat-map?topic=test&timeframe=1d&resolution=hourly")
     assert response.status_code == 200
     
     data = response.json()
@@ -133,70 +144,22 @@ def test_dashboard_heat_map_with_params():
     assert data["topic_filter"] == "test"
 
 
-def test_dashboard_analytics():
-    """Test advanced analytics endpoint"""
-    response = client.get("/api/v1/dashboard/analytics")
-    assert response.status_code == 200
-    
-    data = response.json()
-    assert "engagement_metrics" in data
-    assert "user_demographics" in data
-    assert "platform_performance" in data
-    assert "sentiment_trends" in data
-    assert "topic_sentiment_matrix" in data
-    assert "generated_at" in data
-    
-    # Check engagement metrics structure
-    engagement = data["engagement_metrics"]
-    assert "avg_likes_per_post" in engagement
-    assert "avg_shares_per_post" in engagement
-    assert "avg_comments_per_post" in engagement
-    assert "engagement_rate" in engagement
-    
-    # Check user demographics structure
-    if data["user_demographics"]:
-        demo = data["user_demographics"][0]
-        assert "age_group" in demo
-        assert "percentage" in demo
-        assert "sentiment_bias" in demo
-    
-    # Check platform performance structure
-    if data["platform_performance"]:
-        platform = data["platform_performance"][0]
-        assert "platform" in platform
-        assert "posts" in platform
-        assert "avg_sentiment" in platform
-        assert "response_time" in platform
-
-
-def test_dashboard_summary_enhanced():
-    """Test enhanced dashboard summary endpoint"""
-    response = client.get("/api/v1/dashboard/summary")
-    assert response.status_code == 200
-    
-    data = response.json()
-    # Test new fields in enhanced summary
-    assert "total_posts" in data
-    assert "trending_topics" in data
-    assert "recent_activity" in data
-    assert "performance_metrics" in data
-    
-    # Check trending topics structure
-    if data["trending_topics"]:
-        topic = data["trending_topics"][0]
-        assert "topic" in topic
-        assert "mentions" in topic
-        assert "sentiment_score" in topic
+def test_dashboard_responses_cached(lean_client):
+    """Test identical dashboard requests reuse the cached response"""
+    url = "/api/v1/dashboard/heat-map?topic=cached&timeframe=1d"
+    first = lean_client.get(url).json()
+    second = lean_client.get(url).json()
+    assert first["end_date"] == second["end_date"]
     
-    # Check recent activity structure
-    if data["recent_activity"]:
-        activity = data["recent_activity"][0]
-        assert "timestamp" in activity
-        assert "event" in activity
-    
-    # Check performance metrics structure
-    perf = data["performance_metrics"]
-    assert "avg_processing_time" in perf
-    assert "api_response_time" in perf
-    assert "cache_hit_rate" in perf
-    assert "uptime_percentage" in perf
\ No newline at end of file
+    other = lean_client.get("/api/v1/dashboard/heat-map?topic=other&timeframe=1d").json()
+    assert other["topic_filter"] == "other"
+
+
+def test_dashboard_list_params_cached(lean_client):
+    """Test dashboard requests with list query parameters are cached"""
+    url = "/api/v1/dashboard/interest-trends?regions=North%20America&regions=Europe"
+    first = lean_client.get(url)
+    second = lean_client.get(url)
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.json() == second.json()
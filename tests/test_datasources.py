@@ -130,6 +130,30 @@ class TestDataSource:
         assert "https://example.com" in urls
         assert "http://test.com" in urls
 
+    def test_extract_bounded_matches(self):
+        """Test that tokens longer than the pattern bounds are not extracted"""
+        text = " ".join(
+            [
+                "#" + "a" * 100,
+                "@" + "b" * 100,
+                "https://example.com/" + "c" * 2100,
+                "see https://example.com/path\"quoted",
+            ]
+        )
+        assert self.data_source._extract_hashtags(text) == []
+        assert self.data_source._extract_mentions(text) == []
+        assert self.data_source._extract_urls(text) == ["https://example.com/path"]
+
+    def test_extract_entities(self):
+        """Test extracting hashtags, mentions and URLs in one pass"""
+        text = "#Deal from @Shop at https://shop.example/#top #" + "x" * 65
+        entities = self.data_source._extract_entities(text)
+        assert entities == {
+            "hashtags": ["#deal"],
+            "mentions": ["@shop"],
+            "urls": ["https://shop.example/#top"],
+        }
+
 
 class TestDataSourceManager:
     def test_dynamic_plugin_loading(self):
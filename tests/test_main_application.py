@@ -1,7 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock, Mock
-from src.main import app
+from src.main import app, create_app
 
 
 class TestMainApplication:
@@ -80,3 +80,17 @@ class TestMainApplication:
         assert response.status_code == 200
         result = response.json()
         assert "cache entries" in result["message"]
+
+    def test_security_headers(self):
+        """Test that the default app adds security headers"""
+        response = self.client.get("/health")
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+
+    def test_create_app_without_middleware(self):
+        """Test that the lean app serves the same routes without middleware"""
+        client = TestClient(create_app(enable_middleware=False))
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert "X-Frame-Options" not in response.headers
+        assert client.get("/api/v1/dashboard/summary").status_code == 200
@@ -60,7 +60,7 @@ class TestDatabaseAnalysisRepository:
     @pytest.mark.asyncio
     async def test_save_posts_success(self):
         """Test saving posts successfully"""
-        self.mock_db_manager.store_post = AsyncMock()
+        self.mock_db_manager.store_posts = AsyncMock(return_value=True)
         
         posts = [
             Post(
@@ -78,12 +78,12 @@ class TestDatabaseAnalysisRepository:
         success = await self.repository.save_posts(posts)
         
         assert success is True
-        self.mock_db_manager.store_post.assert_called_once_with(posts[0])
+        self.mock_db_manager.store_posts.assert_called_once_with(posts)
     
     @pytest.mark.asyncio
     async def test_save_posts_failure(self):
         """Test saving posts with error"""
-        self.mock_db_manager.store_post = AsyncMock(side_effect=Exception("DB Error"))
+        self.mock_db_manager.store_posts = AsyncMock(side_effect=Exception("DB Error"))
         
         posts = [Mock()]
         success = await self.repository.save_posts(posts)
@@ -100,7 +100,7 @@ class TestDatabaseAnalysisRepository:
     @pytest.mark.asyncio
     async def test_save_sentiment_results_success(self):
         """Test saving sentiment results successfully"""
-        self.mock_db_manager.store_sentiment_result = AsyncMock()
+        self.mock_db_manager.store_sentiment_results = AsyncMock(return_value=True)
         
         results = [
             SentimentResult(
@@ -117,12 +117,12 @@ class TestDatabaseAnalysisRepository:
         success = await self.repository.save_sentiment_results(results)
         
         assert success is True
-        self.mock_db_manager.store_sentiment_result.assert_called_once_with(results[0])
+        self.mock_db_manager.store_sentiment_results.assert_called_once_with(results)
     
     @pytest.mark.asyncio
     async def test_save_sentiment_results_failure(self):
         """Test saving sentiment results with error"""
-        self.mock_db_manager.store_sentiment_result = AsyncMock(side_effect=Exception("DB Error"))
+        self.mock_db_manager.store_sentiment_results = AsyncMock(side_effect=Exception("DB Error"))
         
         results = [Mock()]
         success = await self.repository.save_sentiment_results(results)
@@ -82,6 +82,17 @@ class TestTextBlobAnalyzer:
             assert "polarity" in result
             assert "subjectivity" in result
 
+    def test_analyze_batch_scores_duplicate_texts_once(self):
+        texts = ["I love this!", "I love this!", "I hate this!"]
+        with patch.object(
+            self.analyzer, "analyze", wraps=self.analyzer.analyze
+        ) as mock_analyze:
+            results = self.analyzer.analyze_batch(texts)
+        assert mock_analyze.call_count == 2
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+        assert results[2]["sentiment"] == SentimentType.NEGATIVE
+
     def test_process_posts(self):
         posts = [
             Post(
@@ -5,10 +5,22 @@ Tests for the service layer components
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
+from src.config.app_config import AppConfig, DatabaseConfig
+from src.core.container import container
 from src.services.analysis_service import AnalysisService
+from src.services import config as service_config
 from src.services.cache_service import CacheService
+from src.services.config import (
+    configure_services,
+    get_analysis_service,
+    get_cache_service,
+    get_data_source_service,
+    get_service,
+    reset_services,
+)
 from src.services.data_source_service import DataSourceService
 from src.models.schemas import SearchQuery, AnalysisResult, DataSourceConfig, SentimentType
+from src.utils.database import DatabaseManager
 
 
 class TestAnalysisService:
@@ -89,6 +101,19 @@ class TestAnalysisService:
             assert result["sentiment"] == "positive"
             assert result["confidence"] == 0.8
 
+    def test_analyze_single_text_reuses_analyzer(self):
+        """Test that the analyzer is created once per name and then reused"""
+        with patch('src.services.analysis_service.SentimentAnalyzerFactory') as mock_factory:
+            mock_analyzer = Mock()
+            mock_analyzer.analyze.return_value = {"sentiment": "neutral", "confidence": 0.5}
+            mock_factory.create_analyzer.return_value = mock_analyzer
+
+            self.service.analyze_single_text("First text", "vader")
+            self.service.analyze_single_text("Second text", "vader")
+
+            mock_factory.create_analyzer.assert_called_once_with("vader")
+            assert mock_analyzer.analyze.call_count == 2
+
 
 class TestCacheService:
     """Test the CacheService"""
@@ -169,6 +194,54 @@ class TestDataSourceService:
         assert sources[0]["name"] == "twitter"
         assert sources[0]["enabled"] is True
     
+    @pytest.mark.asyncio
+    async def test_get_all_sources_cached_until_change(self):
+        """Test that source status is reused until a source changes"""
+        mock_source = Mock()
+        mock_source.config.enabled = True
+        mock_source.is_available.return_value = True
+        mock_source.config.rate_limit = 100
+        mock_source.get_rate_limit_info.return_value = {"remaining": 90}
+        
+        self.mock_data_source_manager.get_configured_sources.return_value = ["twitter"]
+        self.mock_data_source_manager.get_data_source.return_value = mock_source
+        self.mock_data_source_manager.remove_data_source.return_value = True
+        self.mock_data_source_repository.delete_config = AsyncMock()
+        
+        first = self.service.get_all_sources()
+        second = self.service.get_all_sources()
+        
+        assert second == first
+        assert mock_source.is_available.call_count == 1
+        
+        await self.service.remove_source("twitter")
+        self.service.get_all_sources()
+        
+        assert mock_source.is_available.call_count == 2
+    
+    def test_get_all_sources_returns_copies(self):
+        """Test that changing a returned source list does not affect later calls"""
+        mock_source = Mock()
+        mock_source.config.enabled = True
+        mock_source.is_available.return_value = True
+        mock_source.config.rate_limit = 100
+        mock_source.get_rate_limit_info.return_value = {"remaining": 90}
+        
+        self.mock_data_source_manager.get_configured_sources.return_value = ["twitter"]
+        self.mock_data_source_manager.get_data_source.return_value = mock_source
+        
+        sources = self.service.get_all_sources()
+        sources[0]["enabled"] = False
+        sources[0]["rate_limit_info"]["remaining"] = 0
+        sources.append({"name": "extra"})
+        
+        again = self.service.get_all_sources()
+        
+        assert len(again) == 1
+        assert again[0]["enabled"] is True
+        assert again[0]["rate_limit_info"] == {"remaining": 90}
+        assert mock_source.is_available.call_count == 1
+    
     @pytest.mark.asyncio
     async def test_add_source(self):
         """Test adding a data source"""
@@ -224,6 +297,22 @@ class TestDataSourceService:
         
         assert status == expected_status
     
+    @pytest.mark.asyncio
+    async def test_load_configurations_once(self):
+        """Test that configurations are only read from the repository once"""
+        config = DataSourceConfig(name="reddit", enabled=True)
+        self.mock_data_source_repository.get_all_configs = AsyncMock(return_value=[config])
+        
+        await self.service.load_configurations_from_repository()
+        await self.service.load_configurations_from_repository()
+        
+        self.mock_data_source_repository.get_all_configs.assert_called_once()
+        self.mock_data_source_manager.add_data_source.assert_called_once_with(config)
+        
+        await self.service.load_configurations_from_repository(force=True)
+        
+        assert self.mock_data_source_repository.get_all_configs.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_close_all_sources(self):
         """Test closing all data sources"""
@@ -231,4 +320,101 @@ class TestDataSourceService:
         
         await self.service.close_all_sources()
         
-        self.mock_data_source_manager.close_all.assert_called_once()
\ No newline at end of file
+        self.mock_data_source_manager.close_all.assert_called_once()
+
+
+@pytest.fixture
+def restore_services():
+    """Put the shared container registrations back after a test changes them"""
+    saved = (
+        dict(container._services),
+        dict(container._factories),
+        dict(container._singletons),
+        service_config._configured,
+    )
+    yield
+    container.clear()
+    container._services.update(saved[0])
+    container._factories.update(saved[1])
+    container._singletons.update(saved[2])
+    service_config._configured = saved[3]
+    get_analysis_service.cache_clear()
+    get_data_source_service.cache_clear()
+    get_cache_service.cache_clear()
+
+
+class TestServiceConfiguration:
+    """Test the service container configuration"""
+    
+    def test_configure_services_is_idempotent(self):
+        """Test that configuring services again does not re-register them"""
+        factories_before = dict(container._factories)
+        
+        configure_services()
+        
+        assert container._factories == factories_before
+    
+    def test_services_are_singletons(self):
+        """Test that services resolve to the same instance on every lookup"""
+        assert get_service(AnalysisService) is get_service(AnalysisService)
+        assert get_service(DataSourceService) is get_service(DataSourceService)
+        assert get_service(CacheService) is get_service(CacheService)
+    
+    def test_database_manager_is_shared(self):
+        """Test that one database manager is shared by all repositories"""
+        db_manager = get_service(DatabaseManager)
+        
+        assert get_service(DatabaseManager) is db_manager
+        assert get_service(AnalysisService).analysis_repository.db_manager is db_manager
+        assert get_service(DataSourceService).data_source_repository.db_manager is db_manager
+    
+    def test_cached_service_getters(self):
+        """Test that the cached getters return the container's services"""
+        assert get_analysis_service() is get_service(AnalysisService)
+        assert get_data_source_service() is get_service(DataSourceService)
+        assert get_cache_service() is get_service(CacheService)
+    
+    @pytest.mark.asyncio
+    async def test_configure_services_with_sync_sqlite_url(self, restore_services):
+        """Test that a plain sqlite:// DATABASE_URL is served by the async driver"""
+        reset_services()
+        app_config = AppConfig(
+            database=DatabaseConfig(url="sqlite:///./interestify.db")
+        )
+        
+        with patch.object(service_config, "get_app_config", return_value=app_config):
+            configure_services()
+        
+        db_manager = get_service(DatabaseManager)
+        try:
+            assert db_manager.database_url == "sqlite+aiosqlite:///./interestify.db"
+            assert db_manager.engine.dialect.driver == "aiosqlite"
+        finally:
+            await db_manager.close()
+    
+    def test_failed_configuration_is_retried(self, restore_services):
+        """Test that a registration error leaves services unconfigured"""
+        reset_services()
+        
+        with patch.object(
+            service_config, "get_app_config", side_effect=RuntimeError("bad config")
+        ):
+            with pytest.raises(RuntimeError, match="bad config"):
+                configure_services()
+        
+        assert service_config._configured is False
+        assert container._singletons == {}
+    
+    @pytest.mark.asyncio
+    async def test_reset_services(self, restore_services):
+        """Test that resetting services builds new instances on next lookup"""
+        original = get_service(AnalysisService)
+        original_db_manager = get_service(DatabaseManager)
+        
+        assert reset_services() is original_db_manager
+        
+        try:
+            assert get_service(AnalysisService) is not original
+            assert get_analysis_service() is get_service(AnalysisService)
+        finally:
+            await get_service(DatabaseManager).close()
@@ -3,9 +3,12 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from src.core.datasources.base import DataSource
+from src.models.schemas import DataSourceConfig
 from src.utils.pagination import (
     PaginatedResponse,
     create_paginated_response,
+    paginate_iter,
     paginate_results,
 )
 
@@ -89,6 +92,21 @@ class TestPagination:
         assert len(result) == 50  # Default limit
         assert result == list(range(50))
 
+    def test_paginate_results_iterable(self):
+        """Test paginating an iterable that is not a list"""
+        result = paginate_results(iter(range(100)), offset=10, limit=5)
+        assert result == list(range(10, 15))
+
+    def test_paginate_iter_is_lazy(self):
+        """Test that lazy pagination stops consuming after the page"""
+        items = iter(range(100))
+
+        page = paginate_iter(items, offset=10, limit=5)
+        assert list(page) == list(range(10, 15))
+        assert next(items) == 15
+
+        assert list(paginate_iter(range(100), offset=-5, limit=0)) == list(range(50))
+
     def test_create_paginated_response_first_page(self):
         """Test creating paginated response for first page"""
         items = list(range(10))
@@ -220,9 +238,6 @@ class TestTextProcessing:
 
     def test_normalize_text(self):
         """Test text normalization"""
-        from src.core.datasources.base import DataSource
-        from src.models.schemas import DataSourceConfig
-
         config = DataSourceConfig(name="test", enabled=True)
 
         # Create a concrete implementation for testing
@@ -260,9 +275,6 @@ class TestTextProcessing:
 
     def test_extract_hashtags(self):
         """Test hashtag extraction"""
-        from src.core.datasources.base import DataSource
-        from src.models.schemas import DataSourceConfig
-
         config = DataSourceConfig(name="test", enabled=True)
 
         class TestDataSource(DataSource):
@@ -291,9 +303,6 @@ class TestTextProcessing:
 
     def test_extract_mentions(self):
         """Test mention extraction"""
-        from src.core.datasources.base import DataSource
-        from src.models.schemas import DataSourceConfig
-
         config = DataSourceConfig(name="test", enabled=True)
 
         class TestDataSource(DataSource):
@@ -321,9 +330,6 @@ class TestTextProcessing:
 
     def test_extract_urls(self):
         """Test URL extraction"""
-        from src.core.datasources.base import DataSource
-        from src.models.schemas import DataSourceConfig
-
         config = DataSourceConfig(name="test", enabled=True)
 
         class TestDataSource(DataSource):